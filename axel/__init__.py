@@ -14,13 +14,23 @@ from .critic import (
 )
 from .flywheel import evaluate_flywheel_alignment
 from .merge import (
+    MergeDaemon,
     MergePlan,
     load_merge_policy,
     plan_merge_actions,
+    plan_merge_actions_many,
     speculative_merge_check,
+    speculative_merge_check_many,
 )
 from .quests import suggest_cross_repo_quests
-from .repo_manager import add_repo, get_repo_file, list_repos, load_repos, remove_repo
+from .repo_manager import (
+    add_repo,
+    add_repos,
+    get_repo_file,
+    list_repos,
+    load_repos,
+    remove_repo,
+)
 from .task_manager import (
     add_task,
     clear_tasks,
@@ -43,6 +53,7 @@ def run_discord_bot() -> None:
 
 __all__ = [
     "add_repo",
+    "add_repos",
     "get_repo_file",
     "list_repos",
     "load_repos",
@@ -51,8 +62,11 @@ __all__ = [
     "strip_ansi",
     "suggest_cross_repo_quests",
     "MergePlan",
+    "MergeDaemon",
     "speculative_merge_check",
+    "speculative_merge_check_many",
     "plan_merge_actions",
+    "plan_merge_actions_many",
     "load_merge_policy",
     "evaluate_flywheel_alignment",
     "analyze_orthogonality",
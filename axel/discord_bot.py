@@ -6,7 +6,7 @@ import inspect
 import os
 import re
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Sequence
 
@@ -18,7 +18,11 @@ from .quests import suggest_cross_repo_quests
 
 SAVE_DIR = Path("local/discord")
 CONTEXT_LIMIT = 5
-_MIN_CONTEXT_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_MIN_CONTEXT_TIMESTAMP = (
+    datetime.min.replace(tzinfo=timezone.utc) - _EPOCH
+) // _MICROSECOND
 SUMMARY_LINE_LIMIT = 2
 SUMMARY_MAX_CHARS = 280
 _METADATA_PREFIXES: tuple[str, ...] = (
@@ -51,8 +55,12 @@ class DigestEntry:
     summary: str
 
 
-def _context_sort_key(message: discord.Message) -> datetime:
-    """Return a datetime sort key for ``message`` timestamps."""
+def _context_sort_key(message: discord.Message) -> int:
+    """Return ``message``'s timestamp as integer microseconds since the epoch.
+
+    Naive timestamps are treated as UTC. Integer keys keep sort comparisons cheap
+    and avoid re-normalizing timezones on every comparison.
+    """
 
     try:
         timestamp = getattr(message, "created_at", None)
@@ -60,19 +68,48 @@ def _context_sort_key(message: discord.Message) -> datetime:
         return _MIN_CONTEXT_TIMESTAMP
     if isinstance(timestamp, datetime):
         if timestamp.tzinfo is None:
-            return timestamp.replace(tzinfo=timezone.utc)
-        return timestamp
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return (timestamp - _EPOCH) // _MICROSECOND
     return _MIN_CONTEXT_TIMESTAMP
 
 
-def _validate_capture_dir(path: Path, *, require_writable: bool = True) -> Path:
-    """Return ``path`` after resolving it and optionally verifying writability."""
+def _sorted_context(messages: Sequence[discord.Message]) -> list[discord.Message]:
+    """Return ``messages`` ordered oldest-first without aborting on bad keys.
+
+    Keys are computed once per message up front (decorate-sort-undecorate), so a
+    failing :func:`_context_sort_key` only demotes that message to the front of the
+    list instead of abandoning the whole sort. Ties keep their original order.
+    """
+
+    decorated: list[tuple[tuple[object, ...], int, discord.Message]] = []
+    for index, message in enumerate(messages):
+        try:
+            key: tuple[object, ...] = (1, _context_sort_key(message))
+        except Exception:
+            key = (0,)
+        decorated.append((key, index, message))
+    decorated.sort()
+    return [message for _, _, message in decorated]
+
+
+def _resolve_capture_dir(path: Path) -> Path:
+    """Return ``path`` with ``~`` expanded and resolved to an absolute path.
+
+    Paths are resolved on every call so a retargeted symlink or recreated
+    directory is picked up immediately.
+    """
 
-    resolved = path.expanduser()
+    expanded = path.expanduser()
     try:
-        resolved = resolved.resolve(strict=False)
+        return expanded.resolve(strict=False)
     except Exception:
-        resolved = resolved.absolute()
+        return expanded.absolute()
+
+
+def _validate_capture_dir(path: Path, *, require_writable: bool = True) -> Path:
+    """Return ``path`` after resolving it and optionally verifying writability."""
+
+    resolved = _resolve_capture_dir(path)
 
     if not require_writable:
         return resolved
@@ -544,32 +581,30 @@ def save_message(
     author = _display_name(getattr(message, "author", None))
     jump_url = getattr(message, "jump_url", "")
 
-    lines = [f"# {author}", ""]
-    lines.append(f"- Channel: {channel_name or 'unknown'}")
-    if thread_name:
-        lines.append(f"- Thread: {thread_name}")
     matched_repos = _matching_repo_urls(channel_name, thread_name)
-    needs_gabriel = any("token.place" in repo.lower() for repo in matched_repos)
-    for repo_url in matched_repos:
-        lines.append(f"- Repository: {repo_url}")
-    if needs_gabriel:
-        lines.append("- Security: https://github.com/futuroptimist/gabriel")
-    lines.append(f"- Timestamp: {timestamp}")
-    if jump_url:
-        lines.append(f"- Link: {jump_url}")
-    lines.append("")
+    thread_line = f"- Thread: {thread_name}\n" if thread_name else ""
+    repo_lines = "".join(f"- Repository: {repo_url}\n" for repo_url in matched_repos)
+    security_line = (
+        "- Security: https://github.com/futuroptimist/gabriel\n"
+        if any("token.place" in repo.lower() for repo in matched_repos)
+        else ""
+    )
+    link_line = f"- Link: {jump_url}\n" if jump_url else ""
+    header = (
+        f"# {author}\n\n- Channel: {channel_name or 'unknown'}\n"
+        f"{thread_line}{repo_lines}{security_line}"
+        f"- Timestamp: {timestamp}\n{link_line}\n"
+    )
 
     context_lines: list[str] = []
     if context:
-        entries = [
-            ctx
-            for ctx in list(context)
-            if getattr(ctx, "id", None) != getattr(message, "id", None)
-        ]
-        try:
-            entries.sort(key=_context_sort_key)
-        except Exception:
-            pass
+        entries = _sorted_context(
+            [
+                ctx
+                for ctx in list(context)
+                if getattr(ctx, "id", None) != getattr(message, "id", None)
+            ]
+        )
         if CONTEXT_LIMIT is not None and len(entries) > CONTEXT_LIMIT:
             entries = entries[-CONTEXT_LIMIT:]
         for ctx in entries:
@@ -588,23 +623,21 @@ def save_message(
                 context_lines.append(f"  {body}")
             else:
                 context_lines.append("  (no content)")
+    context_block = ""
     if context_lines:
-        lines.append("## Context")
-        lines.extend(context_lines)
-        lines.append("")
+        context_block = "## Context\n" + "\n".join(context_lines) + "\n\n"
 
-    lines.append(message.content)
-    lines.append("")
+    attachment_block = ""
     if attachments:
-        lines.append("## Attachments")
+        attachment_lines: list[str] = []
         for display_name, relative_path in attachments:
             rel = relative_path.as_posix()
             if not rel.startswith("./") and not rel.startswith("../"):
                 rel = f"./{rel}"
-            lines.append(f"- [{display_name}]({rel})")
-        lines.append("")
+            attachment_lines.append(f"- [{display_name}]({rel})\n")
+        attachment_block = "\n## Attachments\n" + "".join(attachment_lines)
 
-    rendered = "\n".join(lines)
+    rendered = f"{header}{context_block}{message.content}\n{attachment_block}"
     encrypter = _get_encrypter()
     if encrypter:
         token = encrypter.encrypt(rendered.encode("utf-8"))
@@ -727,30 +760,25 @@ async def _collect_context(
         collected.append(item)  # type: ignore[arg-type]
 
     if hasattr(history_result, "__aiter__"):
-        iterator = history_result  # type: ignore[assignment]
         try:
-            async for entry in iterator:
+            async for entry in history_result:  # type: ignore[attr-defined]
                 _append(entry)
         except Exception:
             return []
-    else:
-        try:
-            iterator = iter(history_result)  # type: ignore[arg-type]
-        except TypeError:
-            return []
+    elif hasattr(history_result, "__iter__") or hasattr(history_result, "__getitem__"):
+        # ``__getitem__`` covers legacy sequence-protocol iterables.
         try:
-            for entry in iterator:
+            for entry in history_result:  # type: ignore[attr-defined]
                 _append(entry)
         except Exception:
             return []
+    else:
+        return []
 
     if not collected:
         return []
 
-    try:
-        collected.sort(key=_context_sort_key)
-    except Exception:
-        pass
+    collected = _sorted_context(collected)
 
     if limit is not None:
         return collected[:limit]
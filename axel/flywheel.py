@@ -16,6 +16,9 @@ REQUIRED_WORKFLOWS: tuple[str, ...] = (
     "02-tests.yml",
 )
 _API_TIMEOUT = 10
+# Shared session so workflow probes reuse pooled HTTPS connections to the API.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/vnd.github+json"})
 
 
 def _slug_from_url(url: str) -> str:
@@ -44,11 +47,12 @@ def _slug_from_url(url: str) -> str:
 def _workflow_exists(slug: str, filename: str, token: str | None) -> bool:
     """Return ``True`` when ``filename`` exists in the repo's workflow directory."""
 
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = {"Authorization": f"token {token}"} if token else {}
     url = f"https://api.github.com/repos/{slug}/contents/.github/workflows/{filename}"
-    response = requests.get(url, headers=headers, timeout=_API_TIMEOUT)
+    # HEAD returns the same status as GET without downloading the workflow body.
+    response = _SESSION.head(
+        url, headers=headers, timeout=_API_TIMEOUT, allow_redirects=True
+    )
     if response.status_code == 200:
         return True
     if response.status_code == 404:
@@ -108,13 +112,16 @@ def main(argv: Sequence[str] | None = None) -> None:
         return
 
     results = evaluate_flywheel_alignment(repos, token=args.token)
+    lines: List[str] = []
     for result in results:
         slug = str(result["repo"])
         if result.get("aligned"):
-            print(f"{slug}: aligned")
+            lines.append(f"{slug}: aligned")
             continue
         missing = ", ".join(result.get("missing", []))
-        print(f"{slug}: missing {missing}")
+        lines.append(f"{slug}: missing {missing}")
+    if lines:
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI use only
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
+import io
 import json
 import subprocess
+import sys
 import tempfile
 from collections import Counter
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Sequence
 
 import yaml
 
@@ -20,13 +24,25 @@ def _run_git(
     cwd: str | Path,
     check: bool = True,
     capture_output: bool = False,
-) -> subprocess.CompletedProcess[str]:
-    """Run a git command and return the completed process."""
+    input: str | bytes | None = None,
+    text: bool = True,
+) -> subprocess.CompletedProcess[Any]:
+    """Run a git command and return the completed process.
+
+    stdout is only piped for callers that request ``capture_output``; otherwise
+    it is discarded at the OS level. stderr is always piped so a failing
+    command's ``CalledProcessError`` carries git's diagnostics.
+    """
 
-    kwargs: dict[str, object] = {"cwd": cwd, "check": check, "text": True}
-    if capture_output:
-        kwargs["stdout"] = subprocess.PIPE
-        kwargs["stderr"] = subprocess.PIPE
+    kwargs: dict[str, object] = {
+        "cwd": cwd,
+        "check": check,
+        "text": text,
+        "stdout": subprocess.PIPE if capture_output else subprocess.DEVNULL,
+        "stderr": subprocess.PIPE,
+    }
+    if input is not None:
+        kwargs["input"] = input
     return subprocess.run(["git", *args], **kwargs)
 
 
@@ -44,6 +60,29 @@ def _resolve_repository(path: str | Path) -> Path:
     return root
 
 
+def _verify_revisions(repo: Path, *revisions: str) -> list[str]:
+    """Return commit ids for ``revisions`` using a single ``git cat-file`` process.
+
+    Raises ``ValueError`` naming the first revision that does not resolve to a
+    commit.
+    """
+
+    request = "".join(f"{revision}^{{commit}}\n" for revision in revisions)
+    result = _run_git(
+        "cat-file",
+        "--batch-check=%(objectname)",
+        cwd=repo,
+        capture_output=True,
+        input=request,
+    )
+    oids: list[str] = []
+    for revision, line in zip(revisions, result.stdout.splitlines()):
+        if line.endswith(" missing") or line.endswith(" ambiguous"):
+            raise ValueError(f"Unknown revision: {revision}")
+        oids.append(line.strip())
+    return oids
+
+
 def speculative_merge_check(
     repo_path: str | Path,
     base: str,
@@ -51,15 +90,341 @@ def speculative_merge_check(
 ) -> dict[str, object]:
     """Return conflict details for merging ``head`` into ``base`` without committing.
 
-    The function checks out ``base`` in a temporary worktree, attempts a
-    ``git merge --no-commit --no-ff`` with ``head``, and reports whether
-    conflicts occur. The repository is left untouched after the speculative
-    merge completes.
+    The merge runs with ``git merge-tree --write-tree`` on tree objects, so no
+    worktree is checked out or touched. When ``merge-tree`` cannot run (Git older
+    than 2.38, or an error such as unrelated histories), the function falls back
+    to ``git merge --no-commit --no-ff`` in a temporary worktree. Either way the
+    repository is left untouched.
+    """
+
+    repo = _resolve_repository(repo_path)
+    _verify_revisions(repo, base, head)
+
+    merge_result = _run_git(
+        "merge-tree",
+        "--write-tree",
+        "--messages",
+        "--name-only",
+        "-z",
+        base,
+        head,
+        cwd=repo,
+        check=False,
+        capture_output=True,
+    )
+    if merge_result.returncode not in (0, 1):
+        return _worktree_merge_check(repo, base, head)
+
+    tree, conflicted_files, messages, _ = _parse_merge_tree(
+        merge_result.stdout.split("\0")
+    )
+    return _merge_tree_result(
+        repo, merge_result.returncode == 1, tree, conflicted_files, messages
+    )
+
+
+def speculative_merge_check_many(
+    repo_path: str | Path,
+    pairs: Sequence[tuple[str, str]],
+) -> list[dict[str, object]]:
+    """Return :func:`speculative_merge_check` results for each ``(base, head)``.
+
+    All merges run through a single ``git merge-tree --stdin`` process instead of
+    one process per pair. If Git does not support ``--stdin`` or reports a merge
+    it could not run, every pair is checked individually instead.
     """
 
     repo = _resolve_repository(repo_path)
-    _run_git("rev-parse", "--verify", base, cwd=repo, capture_output=True)
-    _run_git("rev-parse", "--verify", head, cwd=repo, capture_output=True)
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    _verify_revisions(repo, *(revision for pair in pairs for revision in pair))
+
+    merge_result = _run_git(
+        *_MERGE_TREE_STDIN_ARGS,
+        cwd=repo,
+        check=False,
+        capture_output=True,
+        input="".join(f"{base} {head}\n" for base, head in pairs),
+    )
+    if merge_result.returncode != 0:
+        return [speculative_merge_check(repo, base, head) for base, head in pairs]
+
+    # Each merge is "<status>\0" followed by the -z output and a closing NUL.
+    # Status 1 means clean, 0 means conflicts, anything else is an error.
+    fields = merge_result.stdout.split("\0")
+    parsed: list[tuple[bool, str, list[str], list[str]]] = []
+    index = 0
+    for _ in pairs:
+        status = fields[index]
+        if status not in ("0", "1"):
+            return [speculative_merge_check(repo, base, head) for base, head in pairs]
+        tree, conflicted_files, messages, index = _parse_merge_tree(fields, index + 1)
+        parsed.append((status == "0", tree, conflicted_files, messages))
+        index += 1
+    return [_merge_tree_result(repo, *entry) for entry in parsed]
+
+
+_MERGE_TREE_STDIN_ARGS = (
+    "merge-tree",
+    "--write-tree",
+    "--stdin",
+    "--messages",
+    "--name-only",
+)
+
+
+class MergeDaemon:
+    """Run many speculative merges in one repository through long-lived git helpers.
+
+    One ``git cat-file --batch`` process (revision checks and conflict
+    classification) and one ``git merge-tree --stdin`` process stay open, so
+    each :meth:`check` is a pipe round trip instead of new git processes. Use it
+    as a context manager, or call :meth:`close` when done. If a helper exits
+    (for example on Git without ``merge-tree --stdin``), that check and all
+    later ones fall back to :func:`speculative_merge_check`.
+    """
+
+    def __init__(self, repo_path: str | Path) -> None:
+        self.repo = _resolve_repository(repo_path)
+        self._closed = False
+        self._pending_terminator = False
+        self._buffer = bytearray()
+        self._objects: subprocess.Popen[bytes] | None = None
+        self._merges: subprocess.Popen[bytes] | None = None
+        self._objects = self._spawn("cat-file", "--batch")
+        try:
+            self._merges = self._spawn(*_MERGE_TREE_STDIN_ARGS)
+        except OSError:
+            self._stop_helpers()
+            raise
+
+    def __enter__(self) -> MergeDaemon:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _spawn(self, *args: str) -> subprocess.Popen[bytes]:
+        return subprocess.Popen(
+            ["git", *args],
+            cwd=self.repo,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _stop_helpers(self) -> None:
+        for process in (self._objects, self._merges):
+            if process is None:
+                continue
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()
+            process.stdout.close()
+        self._objects = None
+        self._merges = None
+
+    def close(self) -> None:
+        """Shut down the git helper processes; safe to call more than once."""
+
+        self._closed = True
+        self._stop_helpers()
+
+    def check(self, base: str, head: str) -> dict[str, object]:
+        """Return :func:`speculative_merge_check` results for ``head`` into ``base``."""
+
+        if self._closed:
+            raise ValueError("MergeDaemon is closed")
+        if self._objects is not None and self._merges is not None:
+            try:
+                return self._check(base, head)
+            except (BrokenPipeError, EOFError):
+                self._stop_helpers()
+        return speculative_merge_check(self.repo, base, head)
+
+    def _query_object(self, name: str) -> tuple[str, bytes] | None:
+        """Look up ``name`` through ``cat-file --batch``; ``None`` if it is missing."""
+
+        self._objects.stdin.write(f"{name}\n".encode("utf-8"))
+        self._objects.stdin.flush()
+        if not self._objects.stdout.peek(1):
+            raise EOFError("git cat-file exited")
+        return _read_batch_object(self._objects.stdout)
+
+    def _read_field(self) -> str:
+        """Return the next NUL-terminated field from ``merge-tree --stdin``."""
+
+        while True:
+            end = self._buffer.find(b"\0")
+            if end != -1:
+                field = self._buffer[:end].decode("utf-8")
+                del self._buffer[: end + 1]
+                return field
+            chunk = self._merges.stdout.read1()
+            if not chunk:
+                raise EOFError("git merge-tree exited")
+            self._buffer += chunk
+
+    def _check(self, base: str, head: str) -> dict[str, object]:
+        for revision in (base, head):
+            if self._query_object(f"{revision}^{{commit}}") is None:
+                raise ValueError(f"Unknown revision: {revision}")
+
+        # git writes the NUL closing a merge only once it reads the next input
+        # line, so every merge is followed by a trivial "base base" sentinel
+        # merge. The sentinel's own closing NUL is consumed on the next call.
+        self._merges.stdin.write(f"{base} {head}\n{base} {base}\n".encode("utf-8"))
+        self._merges.stdin.flush()
+        if self._pending_terminator:
+            self._read_field()
+        status = self._read_field()
+        if status not in ("0", "1"):
+            raise EOFError(f"git merge-tree reported status {status!r}")
+        tree = self._read_field()
+        conflicted_files: list[str] = []
+        name = self._read_field()
+        while name:
+            conflicted_files.append(name)
+            name = self._read_field()
+        # "<path count>\0<paths...>\0<conflict type>\0<message>\0" per
+        # message; the empty field closing the merge ends the list.
+        messages: list[str] = []
+        count = self._read_field()
+        while count:
+            for _ in range(int(count) + 1):
+                self._read_field()
+            messages.append(self._read_field().rstrip("\n"))
+            count = self._read_field()
+        # A clean self-merge prints "1", its tree and an empty message list.
+        sentinel = [self._read_field() for _ in range(3)]
+        if sentinel[0] != "1" or sentinel[2]:
+            raise EOFError("git merge-tree sentinel merge was not clean")
+        self._pending_terminator = True
+
+        conflicts = status == "0"
+        classifications: dict[str, str] = {}
+        if conflicts:
+            for name in conflicted_files:
+                entry = self._query_object(f"{tree}:{name}")
+                classifications[name] = _classify_blob_entry(entry)
+        return _build_merge_result(
+            conflicts, conflicted_files, messages, classifications
+        )
+
+
+def _merge_tree_result(
+    repo: Path,
+    conflicts: bool,
+    tree: str,
+    conflicted_files: list[str],
+    messages: list[str],
+) -> dict[str, object]:
+    """Build the speculative merge result for one ``merge-tree`` merge."""
+
+    classifications: dict[str, str] = {}
+    if conflicts:
+        classifications = _classify_tree_conflicts(repo, tree, conflicted_files)
+    return _build_merge_result(conflicts, conflicted_files, messages, classifications)
+
+
+def _build_merge_result(
+    conflicts: bool,
+    conflicted_files: list[str],
+    messages: list[str],
+    classifications: dict[str, str],
+) -> dict[str, object]:
+    summary = dict(Counter(classifications.values()))
+    return {
+        "conflicts": conflicts,
+        "conflicted_files": conflicted_files,
+        "output": "\n".join(messages),
+        "conflict_classification": classifications,
+        "conflict_summary": summary,
+        "auto_resolvable": _auto_resolvable(summary, conflicts),
+    }
+
+
+def _parse_merge_tree(
+    fields: list[str], index: int = 0
+) -> tuple[str, list[str], list[str], int]:
+    """Parse one ``merge-tree --write-tree --messages --name-only -z`` result.
+
+    ``fields`` is the output split on NUL and ``index`` points at the tree id.
+    Returns the tree id, the conflicted paths, the informational messages with
+    trailing newlines removed, and the index of the field ending the messages.
+    """
+
+    tree = fields[index]
+    index += 1
+    conflicted_files: list[str] = []
+    while index < len(fields) and fields[index]:
+        conflicted_files.append(fields[index])
+        index += 1
+    index += 1
+
+    # Each message is "<path count>\0<paths...>\0<conflict type>\0<message>\0".
+    messages: list[str] = []
+    while index < len(fields) and fields[index]:
+        path_count = int(fields[index])
+        messages.append(fields[index + path_count + 2].rstrip("\n"))
+        index += path_count + 3
+    return tree, conflicted_files, messages, index
+
+
+def _classify_tree_conflicts(
+    repo: Path, tree: str, conflicted_files: list[str]
+) -> dict[str, str]:
+    """Classify conflicted files by reading them from ``tree`` in one git process."""
+
+    if not conflicted_files:
+        return {}
+    request = "".join(f"{tree}:{name}\n" for name in conflicted_files)
+    result = _run_git(
+        "cat-file",
+        "--batch",
+        cwd=repo,
+        capture_output=True,
+        input=request.encode("utf-8"),
+        text=False,
+    )
+    stream = io.BytesIO(result.stdout)
+    return {name: _classify_batch_blob(stream) for name in conflicted_files}
+
+
+def _read_batch_object(stream: BinaryIO) -> tuple[str, bytes] | None:
+    """Read one ``git cat-file --batch`` response as ``(type, payload)``.
+
+    Returns ``None`` for objects reported missing or ambiguous.
+    """
+
+    header = stream.readline().decode("utf-8", errors="ignore")
+    parts = header.rstrip("\n").rsplit(" ", 2)
+    if len(parts) != 3 or not parts[2].isdigit():
+        # "<object> missing" / "<object> ambiguous" carry no payload.
+        return None
+    payload = stream.read(int(parts[2]))
+    stream.read(1)
+    return parts[1], payload
+
+
+def _classify_batch_blob(stream: BinaryIO) -> str:
+    """Classify the conflicted file held by the next ``cat-file --batch`` object."""
+
+    return _classify_blob_entry(_read_batch_object(stream))
+
+
+def _classify_blob_entry(entry: tuple[str, bytes] | None) -> str:
+    if entry is None or entry[0] != "blob":
+        return "unknown"
+    content = entry[1].decode("utf-8", errors="ignore")
+    return _classify_segments(_extract_conflict_segments(content))
+
+
+def _worktree_merge_check(repo: Path, base: str, head: str) -> dict[str, object]:
+    """Run the speculative merge in a temporary worktree and report conflicts."""
 
     with tempfile.TemporaryDirectory(prefix="axel-merge-") as tempdir:
         worktree_path = Path(tempdir)
@@ -89,14 +454,12 @@ def speculative_merge_check(
             if conflicts:
                 status = _run_git(
                     "status",
-                    "--porcelain",
+                    "--porcelain=v2",
+                    "-z",
                     cwd=worktree_path,
                     capture_output=True,
                 )
-                for line in status.stdout.splitlines():
-                    code = line[:2]
-                    if code in _CONFLICT_CODES:
-                        conflicted_files.append(line[3:].strip())
+                conflicted_files = _unmerged_paths(status.stdout)
                 classifications = _classify_conflicts(worktree_path, conflicted_files)
                 summary = dict(Counter(classifications.values()))
                 _run_git(
@@ -104,7 +467,6 @@ def speculative_merge_check(
                     "--abort",
                     cwd=worktree_path,
                     check=False,
-                    capture_output=True,
                 )
             else:
                 summary = {}
@@ -122,7 +484,6 @@ def speculative_merge_check(
                 "--hard",
                 cwd=worktree_path,
                 check=False,
-                capture_output=True,
             )
             _run_git(
                 "worktree",
@@ -131,7 +492,6 @@ def speculative_merge_check(
                 str(worktree_path),
                 cwd=repo,
                 check=False,
-                capture_output=True,
             )
 
 
@@ -154,7 +514,18 @@ def _format_result(base: str, head: str, result: dict[str, object]) -> str:
     return "\n".join(lines)
 
 
-_CONFLICT_CODES: set[str] = {"DD", "AU", "UD", "UA", "DU", "AA", "UU"}
+def _unmerged_paths(status: str) -> list[str]:
+    """Return unmerged paths from ``git status --porcelain=v2 -z`` output."""
+
+    paths: list[str] = []
+    records = iter(status.split("\0"))
+    for record in records:
+        if record.startswith("u "):
+            # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+            paths.append(record.split(" ", 10)[10])
+        elif record.startswith("2 "):
+            next(records, None)  # rename/copy source path is its own field
+    return paths
 
 
 @dataclass(frozen=True)
@@ -195,6 +566,10 @@ def _auto_resolvable(summary: dict[str, int], conflicts: bool) -> bool:
 
 def _extract_conflict_segments(content: str) -> list[tuple[list[str], list[str]]]:
     segments: list[tuple[list[str], list[str]]] = []
+    if "<<<<<<<" not in content:
+        # Delete/modify, rename and binary conflicts leave no markers; a single
+        # substring search skips splitting and scanning the whole file.
+        return segments
     ours: list[str] = []
     theirs: list[str] = []
     state: str | None = None
@@ -218,6 +593,7 @@ def _extract_conflict_segments(content: str) -> list[tuple[list[str], list[str]]
     return segments
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_comment_line(line: str) -> bool:
     stripped = line.strip()
     if not stripped:
@@ -231,9 +607,13 @@ def _is_comment_line(line: str) -> bool:
 
 
 def _prune_common_lines(
-    ours: list[str], theirs: list[str]
+    ours: Sequence[str], theirs: Sequence[str]
 ) -> tuple[list[str], list[str]]:
+    # Counters (not sets) so a line repeated on one side only cancels as many
+    # copies as the other side holds; duplicated code is never hidden.
     theirs_counter = Counter(theirs)
+    if theirs_counter.keys().isdisjoint(ours):
+        return list(ours), list(theirs)
     ours_unique: list[str] = []
     for line in ours:
         if theirs_counter.get(line, 0) > 0:
@@ -250,15 +630,19 @@ def _prune_common_lines(
     return ours_unique, theirs_unique
 
 
+@functools.lru_cache(maxsize=1024)
+def _segment_is_comment_only(ours: tuple[str, ...], theirs: tuple[str, ...]) -> bool:
+    # Memoized because batches of merges often repeat the same conflict hunks
+    # (license headers, generated banners).
+    ours_unique, theirs_unique = _prune_common_lines(ours, theirs)
+    return all(_is_comment_line(line) for line in (*ours_unique, *theirs_unique))
+
+
 def _classify_segments(segments: list[tuple[list[str], list[str]]]) -> str:
     if not segments:
         return "unknown"
     for ours, theirs in segments:
-        ours_unique, theirs_unique = _prune_common_lines(ours, theirs)
-        lines = [*ours_unique, *theirs_unique]
-        if not lines:
-            continue
-        if not all(_is_comment_line(line) for line in lines):
+        if not _segment_is_comment_only(tuple(ours), tuple(theirs)):
             return "code"
     return "comment_only"
 
@@ -279,10 +663,10 @@ def _classify_conflicts(
     return classifications
 
 
-def load_merge_policy(path: str | Path | None = None) -> dict[str, Any]:
-    """Return the configured merge policy as a mapping."""
+@functools.lru_cache(maxsize=16)
+def _parse_merge_policy(location: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the policy at ``location``; the stat fields only key the cache."""
 
-    location = Path(path) if path is not None else _POLICY_PATH
     data = yaml.safe_load(location.read_text(encoding="utf-8"))
     if data is None:
         return {}
@@ -291,6 +675,19 @@ def load_merge_policy(path: str | Path | None = None) -> dict[str, Any]:
     return dict(data)
 
 
+def load_merge_policy(path: str | Path | None = None) -> dict[str, Any]:
+    """Return the configured merge policy as a mapping.
+
+    Parsed policies are cached by path, modification time, and size, so repeated
+    plans reuse the YAML parse until the file changes. Callers receive a deep
+    copy, so mutating the result never leaks into the cache.
+    """
+
+    location = Path(path) if path is not None else _POLICY_PATH
+    stat = location.stat()
+    return copy.deepcopy(_parse_merge_policy(location, stat.st_mtime_ns, stat.st_size))
+
+
 def _match_priority_rule(name: str, rules: Sequence[Mapping[str, Any]]) -> str | None:
     for rule in rules:
         pattern = rule.get("pattern") if isinstance(rule, Mapping) else None
@@ -351,13 +748,46 @@ def plan_merge_actions(
     """Run merge detection and map conflicts to policy guidance."""
 
     policy = load_merge_policy(policy_path)
+    result = speculative_merge_check(repo_path, base, head)
+    return _plan_from_result(base, head, result, policy)
+
+
+def plan_merge_actions_many(
+    repo_path: str | Path,
+    pairs: Sequence[tuple[str, str]],
+    *,
+    policy_path: str | Path | None = None,
+) -> list[MergePlan]:
+    """Return :func:`plan_merge_actions` results for each ``(base, head)`` pair.
+
+    The policy is loaded once and all merges run through
+    :func:`speculative_merge_check_many`, so planning N branches costs one
+    ``merge-tree`` process rather than N.
+    """
+
+    pairs = list(pairs)
+    policy = load_merge_policy(policy_path)
+    results = speculative_merge_check_many(repo_path, pairs)
+    return [
+        _plan_from_result(base, head, result, policy)
+        for (base, head), result in zip(pairs, results)
+    ]
+
+
+def _plan_from_result(
+    base: str,
+    head: str,
+    result: dict[str, Any],
+    policy: Mapping[str, Any],
+) -> MergePlan:
+    """Map one speculative merge ``result`` onto ``policy`` guidance."""
+
     merge_policy = policy.get("merge_policy") if isinstance(policy, Mapping) else {}
     conflict_policy = (
         merge_policy.get("conflict_resolution")
         if isinstance(merge_policy, Mapping)
         else {}
     )
-    result = speculative_merge_check(repo_path, base, head)
     classifications = result.get("conflict_classification") or {}
     if not isinstance(classifications, Mapping):
         classifications = {}
@@ -413,8 +843,22 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=".",
         help="Path to the repository (defaults to current directory)",
     )
-    check_parser.add_argument("--base", required=True, help="Base branch or commit")
-    check_parser.add_argument("--head", required=True, help="Head branch or commit")
+    check_parser.add_argument("--base", help="Base branch or commit")
+    check_parser.add_argument("--head", help="Head branch or commit")
+    check_parser.add_argument(
+        "--batch",
+        type=Path,
+        help="File of 'BASE HEAD' lines to check in one git process",
+    )
+    check_parser.add_argument(
+        "--keep-repo",
+        action="store_true",
+        help=(
+            "With --batch, keep git helpers open and print each result as soon as "
+            "it is ready (JSON output becomes one object per line); use "
+            "'--batch -' to read pairs from stdin"
+        ),
+    )
     check_parser.add_argument(
         "--json",
         action="store_true",
@@ -427,6 +871,66 @@ def main(argv: Sequence[str] | None = None) -> int:
         parser.print_help()
         return 1
 
+    if args.batch is not None and (args.base or args.head):
+        check_parser.error("--batch cannot be combined with --base or --head")
+    if args.keep_repo and args.batch is None:
+        check_parser.error("--keep-repo requires --batch")
+
+    if args.batch is not None:
+
+        def batch_pairs() -> Iterator[tuple[str, str]]:
+            if args.batch == Path("-"):
+                lines: Iterable[str] = sys.stdin
+            else:
+                lines = args.batch.read_text(encoding="utf-8").splitlines()
+            for line in lines:
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
+                parts = stripped.split()
+                if len(parts) != 2:
+                    check_parser.error(
+                        f"Invalid batch line (expected 'BASE HEAD'): {line.rstrip()}"
+                    )
+                yield parts[0], parts[1]
+
+        if args.keep_repo:
+            conflicts = False
+            with MergeDaemon(args.repo) as daemon:
+                for index, (base, head) in enumerate(batch_pairs()):
+                    result = daemon.check(base, head)
+                    conflicts = conflicts or bool(result["conflicts"])
+                    if args.json:
+                        line = json.dumps(
+                            {"base": base, "head": head, **result}, sort_keys=True
+                        )
+                    else:
+                        line = _format_result(base, head, result)
+                        if index:
+                            line = f"\n{line}"
+                    print(line, flush=True)
+            return 1 if conflicts else 0
+
+        pairs = list(batch_pairs())
+        results = speculative_merge_check_many(args.repo, pairs)
+        if args.json:
+            payload = [
+                {"base": base, "head": head, **result}
+                for (base, head), result in zip(pairs, results)
+            ]
+            print(json.dumps(payload, indent=2, sort_keys=True))
+        else:
+            print(
+                "\n\n".join(
+                    _format_result(base, head, result)
+                    for (base, head), result in zip(pairs, results)
+                )
+            )
+        return 1 if any(result["conflicts"] for result in results) else 0
+
+    if not args.base or not args.head:
+        check_parser.error("--base and --head are required unless --batch is given")
+
     result = speculative_merge_check(args.repo, args.base, args.head)
     if args.json:
         print(json.dumps(result, indent=2, sort_keys=True))
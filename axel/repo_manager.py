@@ -4,7 +4,7 @@ import os
 import random
 import sys
 from pathlib import Path
-from typing import List, Sequence
+from typing import Iterable, List, Sequence
 
 import requests
 
@@ -78,17 +78,35 @@ def add_repo(url: str, path: Path | None = None) -> List[str]:
     in ``url`` are removed before processing. Comparison is case-insensitive. The
     resulting list is kept sorted alphabetically regardless of case.
     """
+    return add_repos([url], path=path)
+
+
+def add_repos(urls: Iterable[str], path: Path | None = None) -> List[str]:
+    """Add several repository URLs with a single read and write of the list.
+
+    Each URL is normalized and validated like :func:`add_repo`. If any URL
+    lacks a scheme, :class:`ValueError` is raised before the file is touched.
+    """
     path = _resolve_path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    url = url.strip().rstrip("/")
-    if "://" not in url:
-        raise ValueError(
-            "url must include scheme, e.g., 'https://github.com/user/repo'"
-        )
+    cleaned: List[str] = []
+    for url in urls:
+        url = url.strip().rstrip("/")
+        if "://" not in url:
+            raise ValueError(
+                "url must include scheme, e.g., 'https://github.com/user/repo'"
+            )
+        cleaned.append(url)
     repos = load_repos(path)
     seen = {r.lower() for r in repos}
-    if url and url.lower() not in seen:
-        repos.append(url)
+    added = False
+    for url in cleaned:
+        key = url.lower()
+        if key not in seen:
+            repos.append(url)
+            seen.add(key)
+            added = True
+    if added:
         repos.sort(key=str.lower)
         path.write_text("\n".join(repos) + "\n")
     return repos
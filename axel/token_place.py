@@ -7,6 +7,7 @@ import os
 import sys
 from dataclasses import dataclass
 from functools import lru_cache
+from itertools import product
 from pathlib import Path
 from typing import Iterable, Sequence
 from urllib.parse import urljoin, urlparse
@@ -17,6 +18,8 @@ from .repo_manager import get_repo_file, load_repos
 
 DEFAULT_API_URL = "http://localhost:5000/api/v1"
 DEFAULT_TIMEOUT = 10
+# Shared session so repeated API calls reuse pooled keep-alive connections.
+_SESSION = requests.Session()
 _PREVIEW_PREFERENCE: tuple[str, ...] = (
     "llama-3-8b-instruct:alignment",
     "llama-3-8b-instruct",
@@ -31,7 +34,7 @@ class TokenPlaceError(RuntimeError):
     """Raised when the token.place API cannot satisfy a request."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClientIntegration:
     """Mapping between ``token.place`` and a client repository."""
 
@@ -84,43 +87,44 @@ def _extract_model_ids(payload: object) -> list[str]:
 
 
 def _extract_rotated_keys(payload: object) -> dict[str, str]:
-    """Return rotated token.place keys from ``payload``."""
+    """Return rotated token.place keys from ``payload``.
 
-    containers: list[dict[str, object]] = []
-    seen: set[int] = set()
-
-    def _queue(obj: object) -> None:
-        if isinstance(obj, dict):
-            identifier = id(obj)
-            if identifier in seen:
-                return
-            seen.add(identifier)
-            containers.append(obj)
-            for key in ("data", "keys"):
-                value = obj.get(key)
-                if isinstance(value, dict):
-                    _queue(value)
-                elif isinstance(value, list):
-                    for entry in value:
-                        _queue(entry)
-        elif isinstance(obj, list):
-            for entry in obj:
-                _queue(entry)
-
-    _queue(payload)
+    Containers are walked depth-first with an explicit stack, in the same order
+    as the nested ``data``/``keys`` layout, and the walk stops once every
+    canonical key has been found.
+    """
 
     secrets: dict[str, str] = {}
-    for container in containers:
+    seen: set[int] = set()
+    stack: list[object] = [payload]
+    while stack and len(secrets) < len(_ROTATED_KEY_FIELDS):
+        obj = stack.pop()
+        if isinstance(obj, list):
+            stack.extend(reversed(obj))
+            continue
+        if not isinstance(obj, dict) or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
         for canonical, aliases in _ROTATED_KEY_FIELDS.items():
             if canonical in secrets:
                 continue
             for alias in aliases:
-                value = container.get(alias)
+                value = obj.get(alias)
                 if isinstance(value, str):
                     cleaned = value.strip()
                     if cleaned:
                         secrets[canonical] = cleaned
                         break
+
+        children: list[object] = []
+        for key in ("data", "keys"):
+            value = obj.get(key)
+            if isinstance(value, dict):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(value)
+        stack.extend(reversed(children))
     return secrets
 
 
@@ -140,7 +144,7 @@ def list_models(
 
     url = urljoin(resolved_url + "/", "models")
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
     except requests.RequestException as exc:  # pragma: no cover - network errors mocked
         raise TokenPlaceError(f"Unable to reach token.place at {url}") from exc
 
@@ -175,7 +179,7 @@ def rotate_api_keys(
     url = urljoin(resolved_url + "/", "auth/rotate")
 
     try:
-        response = requests.post(url, headers=headers, timeout=timeout)
+        response = _SESSION.post(url, headers=headers, timeout=timeout)
     except requests.RequestException as exc:  # pragma: no cover - network errors mocked
         raise TokenPlaceError(f"Unable to rotate token.place keys at {url}") from exc
 
@@ -267,49 +271,39 @@ def get_featured_model(
 
 
 def plan_client_integrations(
-    repos: Sequence[str],
+    repos: Iterable[str],
     *,
     base_url: str | None = None,
     api_key: str | None = None,
 ) -> list[ClientIntegration]:
     """Return integration plans pairing token.place with other repositories."""
 
-    unique: list[str] = []
-    seen: set[str] = set()
+    # Lowercase each slug once; the key drives both dedup and token detection.
+    unique: dict[str, str] = {}
     for entry in repos:
         slug = _slug_from_repo_url(entry)
-        if not slug:
-            continue
-        key = slug.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(slug)
+        if slug:
+            unique.setdefault(slug.lower(), slug)
 
-    token_repos = [slug for slug in unique if "token" in slug.lower()]
+    token_repos = [slug for key, slug in unique.items() if "token" in key]
     if not token_repos:
         return []
 
-    token_keys = {slug.lower() for slug in token_repos}
-    client_repos = [slug for slug in unique if slug.lower() not in token_keys]
+    client_repos = [slug for key, slug in unique.items() if "token" not in key]
 
-    integrations: list[ClientIntegration] = []
-    for token_slug in token_repos:
-        for client_slug in client_repos:
-            detail = quest_detail(
+    return [
+        ClientIntegration(
+            token_repo=token_slug,
+            client_repo=client_slug,
+            detail=quest_detail(
                 token_slug,
                 client_slug,
                 base_url=base_url,
                 api_key=api_key,
-            )
-            integrations.append(
-                ClientIntegration(
-                    token_repo=token_slug,
-                    client_repo=client_slug,
-                    detail=detail,
-                )
-            )
-    return integrations
+            ),
+        )
+        for token_slug, client_slug in product(token_repos, client_repos)
+    ]
 
 
 def _normalized_cache_key(
@@ -347,8 +341,9 @@ def _clear_model_cache() -> None:
     _cached_models.cache_clear()
 
 
-def main(argv: Sequence[str] | None = None) -> None:
-    """CLI entry point for token.place helpers."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built once and reused across :func:`main` calls."""
 
     parser = argparse.ArgumentParser(description="token.place helpers")
     sub = parser.add_subparsers(dest="cmd")
@@ -423,7 +418,13 @@ def main(argv: Sequence[str] | None = None) -> None:
         default=None,
         help="token.place API key",
     )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """CLI entry point for token.place helpers."""
 
+    parser = _build_parser()
     if argv is None:
         parsed_args = sys.argv[1:]
     else:
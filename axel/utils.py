@@ -31,4 +31,7 @@ def strip_ansi(text: str | bytes | bytearray | memoryview | None) -> str:
         text = bytes(text).decode("utf-8", "ignore")
     elif not isinstance(text, str):
         raise TypeError("text must be str, bytes, bytearray, memoryview, or None")
+    if "\x1b" not in text:
+        # Plain text is the common case; skip the regex scan entirely.
+        return text
     return ANSI_ESCAPE_RE.sub("", text)
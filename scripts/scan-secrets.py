@@ -5,14 +5,17 @@ Reads text from standard input and searches for keywords commonly used in
 credentials like "token", "secret", "password", or "api_key". If any matches
 are found, messages are printed to stderr and the script exits with status 1.
 """
+
 import re
 import sys
+from typing import TextIO
 
 PATTERN = re.compile(r"(token|secret|password|api[\s_-]*key)", re.IGNORECASE)
 
 
-def main() -> int:
-    data = sys.stdin.read()
+def scan(stream: TextIO, err: TextIO) -> int:
+    """Report added lines in ``stream`` that look like secrets to ``err``."""
+    data = stream.read()
     hits = []
     for i, line in enumerate(data.splitlines(), 1):
         if not line.startswith("+") or line.startswith("+++"):
@@ -23,10 +26,14 @@ def main() -> int:
         if PATTERN.search(content):
             hits.append(f"Potential secret at line {i}: {content.strip()}")
     if hits:
-        print("\n".join(hits), file=sys.stderr)
+        print("\n".join(hits), file=err)
         return 1
     return 0
 
 
+def main() -> int:
+    return scan(sys.stdin, sys.stderr)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import runpy
+import sys
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_HEADING_PREFIXES = ("## ", "### ")
+
+# Make ``axel`` importable from a plain checkout without an editable install.
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+# Environment variables read by axel modules. The CLI tests used to spawn
+# ``python -m`` with only ``PYTHONPATH`` set, so clear these to match.
+_AXEL_ENV_VARS = (
+    "AXEL_REPO_FILE",
+    "AXEL_TASK_FILE",
+    "AXEL_AUTO_FETCH_REPOS",
+    "AXEL_TOKEN_PLACE_URL",
+    "TOKEN_PLACE_API_KEY",
+    "GH_TOKEN",
+    "GITHUB_TOKEN",
+)
+
+
+@pytest.fixture
+def run_module(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Return a helper that runs ``python -m <module> <args>`` in-process."""
+
+    for name in _AXEL_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+    def run(module: str, *args: str) -> None:
+        monkeypatch.setattr(sys, "argv", [module, *args])
+        # Drop the cached import so runpy executes a fresh copy without warning.
+        monkeypatch.delitem(sys.modules, module, raising=False)
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+    return run
+
+
+@pytest.fixture(autouse=True)
+def reset_token_place_cache() -> Iterator[None]:
+    """Keep the token.place model cache from leaking between tests."""
+
+    from axel import token_place
+
+    token_place._clear_model_cache()
+    yield
+    token_place._clear_model_cache()
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Return the contents of ``path`` using a single unbuffered read."""
+
+    with open(path, "rb", buffering=0) as handle:
+        return handle.read()
+
+
+def _read_all(path: Path) -> str:
+    """Return ``path`` decoded as UTF-8 using a single unbuffered read."""
+
+    return _read_bytes(path).decode("utf-8")
+
+
+def _heading_index(lines: Sequence[str]) -> dict[str, int]:
+    """Map lowercased ``##``/``###`` headings to their first line index."""
+
+    headings: dict[str, int] = {}
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith(_HEADING_PREFIXES):
+            headings.setdefault(stripped.lower(), index)
+    return headings
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Return the repository root, resolved once per session."""
+
+    return _REPO_ROOT
+
+
+@pytest.fixture(scope="session")
+def readme_bytes() -> bytes:
+    """Return raw README.md bytes once per session for literal checks."""
+
+    return _read_bytes(_REPO_ROOT / "README.md")
+
+
+@pytest.fixture(scope="session")
+def readme_lines(readme_bytes: bytes) -> tuple[str, ...]:
+    """Return README.md decoded and split into lines once per session."""
+
+    return tuple(readme_bytes.decode("utf-8").splitlines())
+
+
+@pytest.fixture(scope="session")
+def readme_line_set(readme_lines: tuple[str, ...]) -> frozenset[str]:
+    """Return stripped README lines for exact checklist-item lookups."""
+
+    return frozenset(line.strip() for line in readme_lines)
+
+
+@pytest.fixture(scope="session")
+def readme_headings(readme_lines: tuple[str, ...]) -> dict[str, int]:
+    """Return README heading positions keyed by lowercased heading text."""
+
+    return _heading_index(readme_lines)
+
+
+@pytest.fixture(scope="session")
+def dashboard_content() -> str:
+    """Return the release-readiness dashboard once per session."""
+
+    return _read_all(_REPO_ROOT / "docs" / "RELEASE-READINESS-DASHBOARD.md")
+
+
+@pytest.fixture(scope="session")
+def release_notes_content() -> str:
+    """Return the release notes once per session."""
+
+    return _read_all(_REPO_ROOT / "docs" / "RELEASE_NOTES.md")
+
+
+@pytest.fixture(scope="session")
+def release_notes_lines(release_notes_content: str) -> tuple[str, ...]:
+    """Return the release notes split into lines once per session."""
+
+    return tuple(release_notes_content.splitlines())
+
+
+@pytest.fixture(scope="session")
+def release_notes_headings(release_notes_lines: tuple[str, ...]) -> dict[str, int]:
+    """Return release-note heading positions keyed by lowercased heading text."""
+
+    return _heading_index(release_notes_lines)
@@ -2,12 +2,10 @@ import json
 import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))  # noqa: E402
+import pytest
 
-import pytest  # noqa: E402
-
-import axel.cli as cli  # noqa: E402
-from axel.completions import CompletionInstallation, install_completions  # noqa: E402
+import axel.cli as cli
+from axel.completions import CompletionInstallation, install_completions
 
 GOLDEN_DIR = Path(__file__).resolve().parent / "fixtures" / "golden"
 
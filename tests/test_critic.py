@@ -1,21 +1,13 @@
 import importlib
 import json
-import sys
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
 
-def _ensure_repo_on_path() -> None:
-    root = str(Path(__file__).resolve().parents[1])
-    if root not in sys.path:
-        sys.path.insert(0, root)
-
-
 @pytest.fixture()
 def critic_module(monkeypatch):
-    _ensure_repo_on_path()
     module = importlib.import_module("axel.critic")
     monkeypatch.setattr(module, "_CURRENT_REPO", None)
     monkeypatch.setattr(module, "_LATEST_RUN_METRICS", None)
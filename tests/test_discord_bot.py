@@ -1,18 +1,15 @@
 import asyncio
 import os
-import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Sequence
+from typing import Iterator, Sequence
 
 import pytest
 from cryptography.fernet import Fernet
 
 discord = pytest.importorskip("discord")
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))  # noqa: E402
-
 import axel.discord_bot as db  # noqa: E402
 
 
@@ -46,6 +43,14 @@ class DummyMessage:
         self.attachments = attachments or []
 
 
+@pytest.fixture(scope="module")
+def runner() -> Iterator[asyncio.Runner]:
+    """Share one event loop across the module's async calls."""
+
+    with asyncio.Runner() as shared:
+        yield shared
+
+
 def read_markdown(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
@@ -648,7 +653,7 @@ def test_save_message_ignores_context_sort_errors(
     second = DummyMessage("second", mid=41)
     msg = DummyMessage("final", mid=42, channel=DummyChannel("general"))
 
-    def boom(_: object) -> datetime:
+    def boom(_: object) -> int:
         raise RuntimeError("boom")
 
     monkeypatch.setattr(db, "_context_sort_key", boom)
@@ -674,6 +679,36 @@ def test_save_message_includes_metadata(tmp_path: Path) -> None:
     )
 
 
+def test_save_message_renders_context_and_attachments(tmp_path: Path) -> None:
+    db.SAVE_DIR = tmp_path
+    earlier = DummyMessage(
+        "earlier",
+        mid=50,
+        created_at=datetime(2023, 12, 31, tzinfo=timezone.utc),
+        jump_url="https://discord.com/channels/1/2/50",
+    )
+    msg = DummyMessage("hello", mid=51, channel=DummyChannel("general"))
+
+    path = db.save_message(
+        msg,
+        attachments=[("diagram.png", Path("51") / "diagram.png")],
+        context=[earlier],
+    )
+
+    assert read_markdown(path) == (
+        "# user\n\n"
+        "- Channel: general\n"
+        "- Timestamp: 2024-01-01T00:00:00+00:00\n"
+        "- Link: https://discord.com/channels/1/2/3\n\n"
+        "## Context\n"
+        "- user @ 2023-12-31T00:00:00+00:00 (https://discord.com/channels/1/2/50)\n"
+        "  earlier\n\n"
+        "hello\n\n"
+        "## Attachments\n"
+        "- [diagram.png](./51/diagram.png)\n"
+    )
+
+
 def test_save_message_uses_display_name_fallback(tmp_path: Path) -> None:
     db.SAVE_DIR = tmp_path
     msg = DummyMessage("hello", channel=DummyChannel("general"))
@@ -825,6 +860,43 @@ def test_save_message_env_expands_user(tmp_path: Path, monkeypatch) -> None:
     assert "home" in read_markdown(path)
 
 
+def test_resolve_capture_dir_tracks_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first_home = tmp_path / "first"
+    second_home = tmp_path / "second"
+
+    monkeypatch.setenv("HOME", str(first_home))
+    assert db._resolve_capture_dir(Path("~/discord")) == first_home / "discord"
+
+    monkeypatch.setenv("HOME", str(second_home))
+    assert db._resolve_capture_dir(Path("~/discord")) == second_home / "discord"
+
+
+def test_resolve_capture_dir_follows_retargeted_symlink(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "captures"
+    link.symlink_to(first, target_is_directory=True)
+
+    assert db._resolve_capture_dir(link) == first
+
+    link.unlink()
+    link.symlink_to(second, target_is_directory=True)
+
+    assert db._resolve_capture_dir(link) == second
+
+
+def test_resolve_capture_dir_resolves_relative_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    assert db._resolve_capture_dir(Path("captures")) == tmp_path / "captures"
+
+
 def test_get_save_dir_falls_back_when_default_unwritable(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1199,6 +1271,7 @@ def test_search_captures_respects_limit(
 
 def test_search_command_sends_no_results_message(
     monkeypatch: pytest.MonkeyPatch,
+    runner: asyncio.Runner,
 ) -> None:
     intents = discord.Intents.none()
     client = db.AxelClient(intents=intents)
@@ -1214,13 +1287,13 @@ def test_search_command_sends_no_results_message(
     interaction = SimpleNamespace(response=DummyResponse())
     monkeypatch.setattr(db, "search_captures", lambda query: [])
 
-    asyncio.run(command.callback(interaction, "query"))
+    runner.run(command.callback(interaction, "query"))
 
     assert interaction.response.calls == [("No captures found for 'query'.", True)]
 
 
 def test_search_command_handles_non_relative_paths(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     intents = discord.Intents.none()
     client = db.AxelClient(intents=intents)
@@ -1250,7 +1323,7 @@ def test_search_command_handles_non_relative_paths(
 
     interaction = SimpleNamespace(response=DummyResponse())
 
-    asyncio.run(command.callback(interaction, "query"))
+    runner.run(command.callback(interaction, "query"))
 
     assert interaction.response.calls
     message, ephemeral = interaction.response.calls[0]
@@ -1275,7 +1348,7 @@ def test_format_relative_path_returns_basename_when_relpath_fails(
 
 
 def test_summarize_command_handles_non_relative_paths(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     intents = discord.Intents.none()
     client = db.AxelClient(intents=intents)
@@ -1301,7 +1374,7 @@ def test_summarize_command_handles_non_relative_paths(
     )
 
     interaction = DummyInteraction()
-    asyncio.run(command.callback(interaction, query="outside"))
+    runner.run(command.callback(interaction, query="outside"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1347,7 +1420,9 @@ def test_digest_captures_skips_empty_summaries_and_breaks_at_limit(
     assert [path.name for path in seen] == ["skip.md", "keep.md"]
 
 
-def test_capture_message_downloads_attachments(tmp_path: Path) -> None:
+def test_capture_message_downloads_attachments(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     saved: list[Path] = []
@@ -1368,7 +1443,7 @@ def test_capture_message_downloads_attachments(tmp_path: Path) -> None:
     ]
     msg = DummyMessage("with attachments", mid=7, attachments=attachments)
 
-    path = asyncio.run(db.capture_message(msg))
+    path = runner.run(db.capture_message(msg))
 
     assert path == tmp_path / "general" / "7.md"
     attachment_dir = tmp_path / "general" / "7"
@@ -1410,7 +1485,9 @@ class HistoryChannel(DummyChannel):
         return DummyAsyncHistory(self._history_messages)
 
 
-def test_gather_context_reads_channel_history(tmp_path: Path) -> None:
+def test_gather_context_reads_channel_history(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     history_messages = [
@@ -1420,14 +1497,16 @@ def test_gather_context_reads_channel_history(tmp_path: Path) -> None:
     channel = HistoryChannel("threads", history_messages)
     trigger = DummyMessage("mention", mid=30, channel=channel)
 
-    result = asyncio.run(db._gather_context(trigger, limit=2))
+    result = runner.run(db._gather_context(trigger, limit=2))
 
     assert len(result) == 2
     assert [msg.id for msg in result] == [20, 21]
     assert channel.history_calls == [{"limit": 2, "oldest_first": True}]
 
 
-def test_gather_context_without_history_returns_empty(tmp_path: Path) -> None:
+def test_gather_context_without_history_returns_empty(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     class NoHistoryChannel(DummyChannel):
@@ -1435,12 +1514,14 @@ def test_gather_context_without_history_returns_empty(tmp_path: Path) -> None:
 
     trigger = DummyMessage("mention", mid=40, channel=NoHistoryChannel("chat"))
 
-    result = asyncio.run(db._gather_context(trigger))
+    result = runner.run(db._gather_context(trigger))
 
     assert result == []
 
 
-def test_gather_context_typeerror_fallback(tmp_path: Path) -> None:
+def test_gather_context_typeerror_fallback(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     class TypeErrorChannel(DummyChannel):
@@ -1459,7 +1540,7 @@ def test_gather_context_typeerror_fallback(tmp_path: Path) -> None:
     channel = TypeErrorChannel("threads", history_messages)
     trigger = DummyMessage("mention", mid=60, channel=channel)
 
-    result = asyncio.run(db._gather_context(trigger, limit=1))
+    result = runner.run(db._gather_context(trigger, limit=1))
 
     assert [msg.id for msg in result] == [50]
     assert channel.calls == [
@@ -1468,17 +1549,21 @@ def test_gather_context_typeerror_fallback(tmp_path: Path) -> None:
     ]
 
 
-def test_capture_message_without_attachments(tmp_path: Path) -> None:
+def test_capture_message_without_attachments(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
     msg = DummyMessage("just text", mid=8)
-    path = asyncio.run(db.capture_message(msg))
+    path = runner.run(db.capture_message(msg))
     assert path == tmp_path / "general" / "8.md"
     content = read_markdown(path)
     assert "just text" in content
     assert "## Attachments" not in content
 
 
-def test_capture_message_without_channel_context(tmp_path: Path) -> None:
+def test_capture_message_without_channel_context(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     class NoChannelMessage(DummyMessage):
@@ -1487,7 +1572,7 @@ def test_capture_message_without_channel_context(tmp_path: Path) -> None:
             del self.channel
 
     msg = NoChannelMessage()
-    path = asyncio.run(db.capture_message(msg))
+    path = runner.run(db.capture_message(msg))
 
     assert path == tmp_path / "direct-message" / "99.md"
     content = read_markdown(path)
@@ -1495,7 +1580,9 @@ def test_capture_message_without_channel_context(tmp_path: Path) -> None:
     assert "## Context" not in content
 
 
-def test_capture_message_includes_thread_history(tmp_path: Path) -> None:
+def test_capture_message_includes_thread_history(
+    tmp_path: Path, runner: asyncio.Runner
+) -> None:
     db.SAVE_DIR = tmp_path
 
     parent = DummyChannel("general")
@@ -1539,7 +1626,7 @@ def test_capture_message_includes_thread_history(tmp_path: Path) -> None:
         created_at=datetime(2024, 1, 1, 0, 10, tzinfo=timezone.utc),
     )
 
-    path = asyncio.run(db.capture_message(target))
+    path = runner.run(db.capture_message(target))
 
     assert path == tmp_path / "general" / "103.md"
 
@@ -1552,7 +1639,9 @@ def test_capture_message_includes_thread_history(tmp_path: Path) -> None:
     assert first_index < second_index
 
 
-def test_axel_client_captures_thread_mentions(monkeypatch, tmp_path: Path) -> None:
+def test_axel_client_captures_thread_mentions(
+    monkeypatch, tmp_path: Path, runner: asyncio.Runner
+) -> None:
     """Mentions inside thread openers are saved even without message references."""
 
     captured: dict[str, object] = {}
@@ -1588,7 +1677,7 @@ def test_axel_client_captures_thread_mentions(monkeypatch, tmp_path: Path) -> No
 
     client._connection.user = DummyUser()  # type: ignore[attr-defined]
 
-    asyncio.run(client.on_message(message))
+    runner.run(client.on_message(message))
 
     assert captured["message"] is message
     assert captured["context"] and captured["context"][0].content == "history"
@@ -1596,7 +1685,7 @@ def test_axel_client_captures_thread_mentions(monkeypatch, tmp_path: Path) -> No
 
 
 def test_axel_client_excludes_trigger_from_context(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, runner: asyncio.Runner
 ) -> None:
     """Context passed to ``capture_message`` omits the trigger mention itself."""
 
@@ -1644,7 +1733,7 @@ def test_axel_client_excludes_trigger_from_context(
 
     client._connection.user = DummyUser()  # type: ignore[attr-defined]
 
-    asyncio.run(client.on_message(message))
+    runner.run(client.on_message(message))
 
     assert captured["original"] is parent
     context_ids = [msg.id for msg in captured["context"]]
@@ -1668,7 +1757,7 @@ class DummyInteraction:
 
 
 def test_axel_search_command_replies_with_matches(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
     msg = DummyMessage("searchable content", mid=20, channel=DummyChannel("updates"))
@@ -1684,7 +1773,7 @@ def test_axel_search_command_replies_with_matches(
     )
 
     interaction = DummyInteraction()
-    asyncio.run(search_command.callback(interaction, query="searchable"))
+    runner.run(search_command.callback(interaction, query="searchable"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1692,7 +1781,7 @@ def test_axel_search_command_replies_with_matches(
 
 
 def test_axel_summarize_command_replies_with_summary(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
     msg = DummyMessage(
@@ -1712,7 +1801,7 @@ def test_axel_summarize_command_replies_with_summary(
     )
 
     interaction = DummyInteraction()
-    asyncio.run(summarize_command.callback(interaction, query="summary"))
+    runner.run(summarize_command.callback(interaction, query="summary"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1722,7 +1811,7 @@ def test_axel_summarize_command_replies_with_summary(
 
 
 def test_axel_quest_command_replies_with_suggestion(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
     capture = tmp_path / "channel" / "42.md"
@@ -1769,7 +1858,7 @@ def test_axel_quest_command_replies_with_suggestion(
     monkeypatch.setattr(db, "suggest_cross_repo_quests", _fake_suggest)
 
     interaction = DummyInteraction()
-    asyncio.run(quest_command.callback(interaction, query="token"))
+    runner.run(quest_command.callback(interaction, query="token"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1780,7 +1869,7 @@ def test_axel_quest_command_replies_with_suggestion(
 
 
 def test_axel_quest_command_reports_missing_repositories(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
     capture = tmp_path / "projects" / "1.md"
@@ -1809,7 +1898,7 @@ def test_axel_quest_command_reports_missing_repositories(
     monkeypatch.setattr(db, "search_captures", _fake_search)
 
     interaction = DummyInteraction()
-    asyncio.run(quest_command.callback(interaction, query="solo"))
+    runner.run(quest_command.callback(interaction, query="solo"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content == (
@@ -1817,7 +1906,9 @@ def test_axel_quest_command_reports_missing_repositories(
     )
 
 
-def test_axel_quest_command_reports_no_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_axel_quest_command_reports_no_matches(
+    monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
+) -> None:
     intents = discord.Intents.none()
     client = db.AxelClient(intents=intents)
 
@@ -1830,14 +1921,14 @@ def test_axel_quest_command_reports_no_matches(monkeypatch: pytest.MonkeyPatch)
     monkeypatch.setattr(db, "search_captures", lambda *_, **__: [])
 
     interaction = DummyInteraction()
-    asyncio.run(quest_command.callback(interaction, query="void"))
+    runner.run(quest_command.callback(interaction, query="void"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content == "No captures found for 'void'."
 
 
 def test_axel_quest_command_reports_missing_suggestions(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     intents = discord.Intents.none()
     client = db.AxelClient(intents=intents)
@@ -1866,7 +1957,7 @@ def test_axel_quest_command_reports_missing_suggestions(
     monkeypatch.setattr(db, "suggest_cross_repo_quests", lambda *_args, **_kwargs: [])
 
     interaction = DummyInteraction()
-    asyncio.run(quest_command.callback(interaction, query="void"))
+    runner.run(quest_command.callback(interaction, query="void"))
 
     assert interaction.response.ephemeral is True
     expected_rel = Path(
@@ -1879,7 +1970,7 @@ def test_axel_quest_command_reports_missing_suggestions(
 
 
 def test_axel_quest_command_handles_non_relative_paths(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     """Quest command emits relative paths even when captures live elsewhere."""
 
@@ -1922,7 +2013,7 @@ def test_axel_quest_command_handles_non_relative_paths(
     monkeypatch.setattr(db, "_get_save_dir", lambda *, require_writable=True: root)
 
     interaction = DummyInteraction()
-    asyncio.run(quest_command.callback(interaction, query="quest"))
+    runner.run(quest_command.callback(interaction, query="quest"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1932,7 +2023,7 @@ def test_axel_quest_command_handles_non_relative_paths(
 
 
 def test_axel_summarize_command_reports_no_matches(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     root = tmp_path / "captures"
     root.mkdir()
@@ -1956,14 +2047,14 @@ def test_axel_summarize_command_reports_no_matches(
     monkeypatch.setattr(db, "search_captures", _fake_search)
 
     interaction = DummyInteraction()
-    asyncio.run(summarize_command.callback(interaction, query="missing"))
+    runner.run(summarize_command.callback(interaction, query="missing"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content == "No captures found for 'missing'."
 
 
 def test_axel_digest_command_replies_with_digest(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
     first = DummyMessage(
@@ -1989,7 +2080,7 @@ def test_axel_digest_command_replies_with_digest(
     )
 
     interaction = DummyInteraction()
-    asyncio.run(digest_command.callback(interaction, query="digestible"))
+    runner.run(digest_command.callback(interaction, query="digestible"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -1999,7 +2090,7 @@ def test_axel_digest_command_replies_with_digest(
 
 
 def test_axel_digest_command_reports_no_matches(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     monkeypatch.setenv("AXEL_DISCORD_DIR", str(tmp_path))
 
@@ -2020,14 +2111,14 @@ def test_axel_digest_command_reports_no_matches(
     monkeypatch.setattr(db, "digest_captures", _fake_digest)
 
     interaction = DummyInteraction()
-    asyncio.run(digest_command.callback(interaction, query="missing"))
+    runner.run(digest_command.callback(interaction, query="missing"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content == "No captures found for 'missing'."
 
 
 def test_axel_digest_command_handles_paths_outside_root(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     """Digest command renders relative paths even outside the configured root."""
 
@@ -2051,7 +2142,7 @@ def test_axel_digest_command_handles_paths_outside_root(
     monkeypatch.setattr(db, "digest_captures", _fake_digest)
 
     interaction = DummyInteraction()
-    asyncio.run(digest_command.callback(interaction, query="external"))
+    runner.run(digest_command.callback(interaction, query="external"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -2061,7 +2152,7 @@ def test_axel_digest_command_handles_paths_outside_root(
 
 
 def test_axel_summarize_command_reports_missing_summary(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, runner: asyncio.Runner
 ) -> None:
     root = tmp_path / "captures"
     root.mkdir()
@@ -2088,7 +2179,7 @@ def test_axel_summarize_command_reports_missing_summary(
     monkeypatch.setattr(db, "search_captures", _fake_search)
 
     interaction = DummyInteraction()
-    asyncio.run(summarize_command.callback(interaction, query="missing"))
+    runner.run(summarize_command.callback(interaction, query="missing"))
 
     assert interaction.response.ephemeral is True
     assert interaction.response.content is not None
@@ -2098,17 +2189,17 @@ def test_axel_summarize_command_reports_missing_summary(
     )
 
 
-def test_collect_context_handles_history_type_error() -> None:
+def test_collect_context_handles_history_type_error(runner: asyncio.Runner) -> None:
     class LimitedHistoryChannel(DummyChannel):
         def history(self, *, limit: int | None = None):
             return None
 
     msg = DummyMessage("history", channel=LimitedHistoryChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
     assert context == []
 
 
-def test_collect_context_returns_empty_on_history_error() -> None:
+def test_collect_context_returns_empty_on_history_error(runner: asyncio.Runner) -> None:
     class ErrorChannel(DummyChannel):
         def history(
             self,
@@ -2119,11 +2210,13 @@ def test_collect_context_returns_empty_on_history_error() -> None:
             raise RuntimeError("missing permissions")
 
     msg = DummyMessage("history", channel=ErrorChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
     assert context == []
 
 
-def test_collect_context_returns_empty_on_iteration_error() -> None:
+def test_collect_context_returns_empty_on_iteration_error(
+    runner: asyncio.Runner,
+) -> None:
     class BrokenHistory:
         def __aiter__(self):
             return self
@@ -2141,11 +2234,11 @@ def test_collect_context_returns_empty_on_iteration_error() -> None:
             return BrokenHistory()
 
     msg = DummyMessage("history", channel=BrokenChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
     assert context == []
 
 
-def test_collect_context_returns_empty_on_await_error() -> None:
+def test_collect_context_returns_empty_on_await_error(runner: asyncio.Runner) -> None:
     class AwaitErrorChannel(DummyChannel):
         async def history(
             self,
@@ -2156,11 +2249,13 @@ def test_collect_context_returns_empty_on_await_error() -> None:
             raise RuntimeError("network failure")
 
     msg = DummyMessage("history", channel=AwaitErrorChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
     assert context == []
 
 
-def test_collect_context_handles_awaitable_and_list_history() -> None:
+def test_collect_context_handles_awaitable_and_list_history(
+    runner: asyncio.Runner,
+) -> None:
     parent = DummyChannel("general")
 
     class AwaitableChannel(DummyChannel):
@@ -2188,12 +2283,12 @@ def test_collect_context_handles_awaitable_and_list_history() -> None:
         created_at=datetime(2024, 1, 1, 0, 2, tzinfo=timezone.utc),
     )
 
-    context = asyncio.run(db._collect_context(target))
+    context = runner.run(db._collect_context(target))
     ids = [ctx.id for ctx in context]
     assert ids == [202, 201]
 
 
-def test_collect_context_skips_falsy_and_self_entries() -> None:
+def test_collect_context_skips_falsy_and_self_entries(runner: asyncio.Runner) -> None:
     class FalsyChannel(DummyChannel):
         def history(
             self,
@@ -2205,12 +2300,12 @@ def test_collect_context_skips_falsy_and_self_entries() -> None:
             return [None, before]
 
     target = DummyMessage("target", channel=FalsyChannel("general"))
-    context = asyncio.run(db._collect_context(target))
+    context = runner.run(db._collect_context(target))
 
     assert context == []
 
 
-def test_collect_context_handles_non_iterable_history() -> None:
+def test_collect_context_handles_non_iterable_history(runner: asyncio.Runner) -> None:
     class NonIterableChannel(DummyChannel):
         def history(
             self,
@@ -2222,12 +2317,14 @@ def test_collect_context_handles_non_iterable_history() -> None:
             return 42
 
     msg = DummyMessage("history", channel=NonIterableChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
 
     assert context == []
 
 
-def test_collect_context_returns_empty_on_sync_iteration_error() -> None:
+def test_collect_context_returns_empty_on_sync_iteration_error(
+    runner: asyncio.Runner,
+) -> None:
     class BadIterable:
         def __iter__(self):
             return self
@@ -2246,12 +2343,41 @@ def test_collect_context_returns_empty_on_sync_iteration_error() -> None:
             return BadIterable()
 
     msg = DummyMessage("history", channel=SyncErrorChannel("general"))
-    context = asyncio.run(db._collect_context(msg))
+    context = runner.run(db._collect_context(msg))
 
     assert context == []
 
 
-def test_collect_context_normalizes_naive_timestamps_when_unbounded() -> None:
+def test_collect_context_accepts_sequence_protocol_history(
+    runner: asyncio.Runner,
+) -> None:
+    class LegacySequence:
+        def __init__(self, items: list[DummyMessage]) -> None:
+            self._items = items
+
+        def __getitem__(self, index: int) -> DummyMessage:
+            return self._items[index]
+
+    class LegacyChannel(DummyChannel):
+        def history(
+            self,
+            *,
+            limit: int | None = None,
+            before: DummyMessage | None = None,
+            **_: object,
+        ):
+            return LegacySequence([DummyMessage("ctx", mid=510, channel=self)])
+
+    target = DummyMessage("latest", mid=511, channel=LegacyChannel("general"))
+
+    context = runner.run(db._collect_context(target))
+
+    assert [ctx.id for ctx in context] == [510]
+
+
+def test_collect_context_normalizes_naive_timestamps_when_unbounded(
+    runner: asyncio.Runner,
+) -> None:
     class MixedTimestampChannel(DummyChannel):
         def history(
             self,
@@ -2282,12 +2408,12 @@ def test_collect_context_normalizes_naive_timestamps_when_unbounded() -> None:
         created_at=datetime(2024, 1, 1, 0, 5, tzinfo=timezone.utc),
     )
 
-    context = asyncio.run(db._collect_context(target, limit=None))
+    context = runner.run(db._collect_context(target, limit=None))
 
     assert [ctx.id for ctx in context] == [310, 311]
 
 
-def test_collect_context_ignores_sort_failures() -> None:
+def test_collect_context_ignores_sort_failures(runner: asyncio.Runner) -> None:
     class ExplodingMessage(DummyMessage):
         @property
         def created_at(self):
@@ -2308,13 +2434,14 @@ def test_collect_context_ignores_sort_failures() -> None:
             return [ExplodingMessage("ctx", mid=410, channel=self)]
 
     target = DummyMessage("latest", mid=411, channel=ExplodingChannel("general"))
-    context = asyncio.run(db._collect_context(target))
+    context = runner.run(db._collect_context(target))
 
     assert [ctx.id for ctx in context] == [410]
 
 
 def test_collect_context_handles_sort_errors(
     monkeypatch: pytest.MonkeyPatch,
+    runner: asyncio.Runner,
 ) -> None:
     """Errors during context sorting should not break collection."""
 
@@ -2333,16 +2460,55 @@ def test_collect_context_handles_sort_errors(
 
     target = DummyMessage("latest", mid=422, channel=SortyChannel("general"))
 
-    def boom(_: object) -> datetime:
+    def boom(_: object) -> int:
         raise RuntimeError("boom")
 
     monkeypatch.setattr(db, "_context_sort_key", boom)
 
-    context = asyncio.run(db._collect_context(target))
+    context = runner.run(db._collect_context(target))
 
     assert [ctx.id for ctx in context] == [420, 421]
 
 
+def test_context_sort_key_returns_epoch_microseconds() -> None:
+    aware = DummyMessage(
+        "aware", created_at=datetime(1970, 1, 1, 0, 0, 1, 5, timezone.utc)
+    )
+    naive = DummyMessage("naive", created_at=datetime(1970, 1, 1, 0, 0, 1, 5))
+    missing = DummyMessage("missing")
+    missing.created_at = None
+
+    assert db._context_sort_key(aware) == 1_000_005
+    assert db._context_sort_key(naive) == 1_000_005
+    assert db._context_sort_key(missing) < db._context_sort_key(aware)
+
+
+def test_sorted_context_demotes_failing_keys_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A single bad sort key should not prevent ordering the rest."""
+
+    newer = DummyMessage(
+        "newer", mid=430, created_at=datetime(2024, 1, 1, 0, 2, tzinfo=timezone.utc)
+    )
+    broken = DummyMessage("broken", mid=431)
+    older = DummyMessage(
+        "older", mid=432, created_at=datetime(2024, 1, 1, 0, 1, tzinfo=timezone.utc)
+    )
+    original = db._context_sort_key
+
+    def flaky(message: object) -> int:
+        if message is broken:
+            raise RuntimeError("boom")
+        return original(message)
+
+    monkeypatch.setattr(db, "_context_sort_key", flaky)
+
+    ordered = db._sorted_context([newer, broken, older])
+
+    assert [ctx.id for ctx in ordered] == [431, 432, 430]
+
+
 def test_run_missing_token(monkeypatch) -> None:
     """``run`` exits if ``DISCORD_BOT_TOKEN`` is not set."""
     monkeypatch.delenv("DISCORD_BOT_TOKEN", raising=False)
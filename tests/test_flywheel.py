@@ -27,11 +27,13 @@ def test_evaluate_flywheel_alignment_reports_missing_workflows(
     calls: list[str] = []
     responses = make_responses([200, 404])
 
-    def fake_get(url: str, *, headers: dict[str, str], timeout: int) -> DummyResponse:
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
         calls.append(url)
         return next(responses)
 
-    monkeypatch.setattr(flywheel.requests, "get", fake_get)
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
 
     repos = ["https://github.com/example/project"]
     results = flywheel.evaluate_flywheel_alignment(repos)
@@ -53,10 +55,12 @@ def test_evaluate_flywheel_alignment_reports_missing_workflows(
 def test_evaluate_handles_unparseable_entry(monkeypatch: pytest.MonkeyPatch) -> None:
     responses = make_responses([404, 404])
 
-    def fake_get(url: str, *, headers: dict[str, str], timeout: int) -> DummyResponse:
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
         return next(responses)
 
-    monkeypatch.setattr(flywheel.requests, "get", fake_get)
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
 
     results = flywheel.evaluate_flywheel_alignment(["example-project"])
 
@@ -71,11 +75,13 @@ def test_evaluate_includes_token(monkeypatch: pytest.MonkeyPatch) -> None:
     captured: list[str | None] = []
     responses = make_responses([200, 200])
 
-    def fake_get(url: str, *, headers: dict[str, str], timeout: int) -> DummyResponse:
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
         captured.append(headers.get("Authorization"))
         return next(responses)
 
-    monkeypatch.setattr(flywheel.requests, "get", fake_get)
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
 
     flywheel.evaluate_flywheel_alignment(
         ["https://github.com/example/project"], token="abc123"
@@ -84,6 +90,21 @@ def test_evaluate_includes_token(monkeypatch: pytest.MonkeyPatch) -> None:
     assert captured == ["token abc123", "token abc123"]
 
 
+def test_workflow_exists_follows_redirects(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: dict[str, object] = {}
+
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
+        seen["allow_redirects"] = allow_redirects
+        return DummyResponse(200)
+
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
+
+    assert flywheel._workflow_exists("owner/repo", "02-tests.yml", None)
+    assert seen["allow_redirects"] is True
+
+
 def test_main_prints_alignment_summary(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -121,10 +142,12 @@ def test_main_prints_alignment_summary(
 def test_evaluate_accepts_slug_without_scheme(monkeypatch: pytest.MonkeyPatch) -> None:
     responses = make_responses([200, 200])
 
-    def fake_get(url: str, *, headers: dict[str, str], timeout: int) -> DummyResponse:
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
         return next(responses)
 
-    monkeypatch.setattr(flywheel.requests, "get", fake_get)
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
 
     results = flywheel.evaluate_flywheel_alignment(["owner/project"])
 
@@ -177,10 +200,12 @@ def test_workflow_exists_raises_on_unexpected_status(
         def raise_for_status(self) -> None:
             raise RuntimeError("boom")
 
-    def fake_get(url: str, *, headers: dict[str, str], timeout: int) -> DummyResponse:
+    def fake_head(
+        url: str, *, headers: dict[str, str], timeout: int, allow_redirects: bool
+    ) -> DummyResponse:
         return ErrorResponse(500)
 
-    monkeypatch.setattr(flywheel.requests, "get", fake_get)
+    monkeypatch.setattr(flywheel._SESSION, "head", fake_head)
 
     with pytest.raises(RuntimeError):
         flywheel._workflow_exists(
@@ -190,6 +215,10 @@ def test_workflow_exists_raises_on_unexpected_status(
         )
 
 
+def test_session_sends_github_accept_header() -> None:
+    assert flywheel._SESSION.headers["Accept"] == "application/vnd.github+json"
+
+
 def test_slug_from_url_invalid() -> None:
     with pytest.raises(ValueError):
         flywheel._slug_from_url("not-a-repo")
@@ -220,3 +249,23 @@ def test_main_passes_token_to_evaluate(
     flywheel.main(["--path", str(repo_file), "--token", "secret-token"])
 
     assert captured["token"] == "secret-token"
+
+
+def test_main_prints_one_line_per_repo(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    repo_file = tmp_path / "repos.txt"
+    repo_file.write_text("a/one\nb/two\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        flywheel,
+        "evaluate_flywheel_alignment",
+        lambda repos, token=None: [
+            {"repo": "a/one", "missing": [], "aligned": True},
+            {"repo": "b/two", "missing": ["02-tests.yml"], "aligned": False},
+        ],
+    )
+
+    flywheel.main(["--path", str(repo_file)])
+
+    assert capsys.readouterr().out == ("a/one: aligned\nb/two: missing 02-tests.yml\n")
@@ -1,24 +1,29 @@
 from __future__ import annotations
 
-import re
+from functools import cache
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@cache
+def _read(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
 
 def test_llms_sample_repo_link_exists() -> None:
     """The llms.txt sample repo link should exist and contain URLs."""
 
-    root = Path(__file__).resolve().parents[1]
-    llms_file = root / "llms.txt"
-    content = llms_file.read_text(encoding="utf-8")
+    content = _read(ROOT / "llms.txt")
 
-    match = re.search(r"\[Sample repos list]\(([^)]+)\)", content)
-    assert match, "llms.txt must link to the sample repo list"
+    _, found, rest = content.partition("[Sample repos list](")
+    link, closed, _ = rest.partition(")")
+    assert found and closed and link, "llms.txt must link to the sample repo list"
 
-    link = match.group(1)
-    sample_path = (root / Path(link)).resolve()
+    sample_path = (ROOT / Path(link)).resolve()
     assert sample_path.exists(), f"Sample repo list not found at {link}"
 
-    raw_lines = sample_path.read_text(encoding="utf-8").splitlines()
+    raw_lines = _read(sample_path).splitlines()
     lines = [line.strip() for line in raw_lines]
     repo_lines = [line for line in lines if line and not line.startswith("#")]
     assert repo_lines, "Sample repo list should include at least one repository entry"
@@ -1,25 +1,37 @@
 from __future__ import annotations
 
+import io
+import json
+import shutil
+import signal
 import subprocess
 from pathlib import Path
+from types import MappingProxyType
+from typing import Iterator, Mapping
 
 import pytest
 
+from axel import merge as merge_module
 from axel.merge import (
+    MergeDaemon,
     MergePlan,
     load_merge_policy,
     plan_merge_actions,
+    plan_merge_actions_many,
     speculative_merge_check,
+    speculative_merge_check_many,
 )
 
+# Resolve git once so test setup calls skip the PATH search.
+GIT = shutil.which("git") or "git"
 
-def _run_git(*args: str, cwd: Path) -> subprocess.CompletedProcess[str]:
+
+def _run_git(*args: str, cwd: Path) -> subprocess.CompletedProcess[bytes]:
     return subprocess.run(
-        ["git", *args],
+        [GIT, *args],
         cwd=cwd,
         check=True,
-        text=True,
-        stdout=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
     )
 
@@ -29,14 +41,83 @@ def _init_repo(path: Path) -> Path:
     repo = path / "repo"
     repo.mkdir()
     _run_git("init", "-b", "main", cwd=repo)
-    _run_git("config", "user.name", "Axel", cwd=repo)
-    _run_git("config", "user.email", "axel@example.com", cwd=repo)
+    # Append the identity directly instead of spawning two ``git config`` calls.
+    with (repo / ".git" / "config").open("a", encoding="utf-8") as config:
+        config.write("[user]\n\tname = Axel\n\temail = axel@example.com\n")
     return repo
 
 
+def _build_history(
+    repo: Path,
+    initial: dict[str, str],
+    *,
+    feature: dict[str, str | None],
+    main: dict[str, str | None],
+) -> None:
+    """Create ``main``/``feature`` histories with a single ``git fast-import``.
+
+    ``initial`` seeds the root commit on ``main``; ``feature`` branches from it
+    and ``main`` then advances independently. ``None`` deletes a file.
+    """
+
+    stream = bytearray()
+
+    def _data(payload: str) -> None:
+        encoded = payload.encode("utf-8")
+        stream.extend(b"data %d\n%s\n" % (len(encoded), encoded))
+
+    def _commit(
+        branch: str,
+        message: str,
+        files: Mapping[str, str | None],
+        *,
+        parent: str | None = None,
+        mark: str | None = None,
+    ) -> None:
+        stream.extend(f"commit refs/heads/{branch}\n".encode("utf-8"))
+        if mark:
+            stream.extend(f"mark {mark}\n".encode("utf-8"))
+        stream.extend(b"committer Axel <axel@example.com> 0 +0000\n")
+        _data(message)
+        if parent:
+            stream.extend(f"from {parent}\n".encode("utf-8"))
+        for name, content in files.items():
+            if content is None:
+                stream.extend(f"D {name}\n".encode("utf-8"))
+            else:
+                stream.extend(f"M 100644 inline {name}\n".encode("utf-8"))
+                _data(content)
+
+    _commit("main", "initial", initial, mark=":1")
+    _commit("feature", "feature", feature, parent=":1")
+    _commit("main", "main", main, parent=":1")
+    subprocess.run(
+        [GIT, "fast-import", "--quiet"],
+        cwd=repo,
+        input=bytes(stream),
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+@pytest.fixture(scope="session")
+def template_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Initialize and configure one empty repository for the whole session.
+
+    Tests only ever receive copies, so the template is never mutated. Under
+    pytest-xdist each worker has its own base temp directory and builds its own
+    template, so no cross-worker locking is required.
+    """
+
+    return _init_repo(tmp_path_factory.mktemp("repo-template"))
+
+
 @pytest.fixture()
-def git_repo(tmp_path: Path) -> Path:
-    return _init_repo(tmp_path)
+def git_repo(tmp_path: Path, template_repo: Path) -> Path:
+    repo = tmp_path / "repo"
+    shutil.copytree(template_repo, repo)
+    return repo
 
 
 def test_speculative_merge_requires_existing_repo(tmp_path: Path) -> None:
@@ -44,20 +125,25 @@ def test_speculative_merge_requires_existing_repo(tmp_path: Path) -> None:
         speculative_merge_check(tmp_path / "missing", "main", "feature")
 
 
-def test_speculative_merge_reports_clean_result(git_repo: Path) -> None:
-    (git_repo / "base.txt").write_text("seed\n", encoding="utf-8")
-    _run_git("add", "base.txt", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
+def test_speculative_merge_rejects_unknown_revision(git_repo: Path) -> None:
+    _build_history(
+        git_repo,
+        {"base.txt": "seed\n"},
+        feature={"feature.txt": "feature\n"},
+        main={"main.txt": "main\n"},
+    )
 
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "feature.txt").write_text("feature\n", encoding="utf-8")
-    _run_git("add", "feature.txt", cwd=git_repo)
-    _run_git("commit", "-m", "feature", cwd=git_repo)
+    with pytest.raises(ValueError, match="missing-branch"):
+        speculative_merge_check(git_repo, "main", "missing-branch")
 
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "main.txt").write_text("main\n", encoding="utf-8")
-    _run_git("add", "main.txt", cwd=git_repo)
-    _run_git("commit", "-m", "main", cwd=git_repo)
+
+def test_speculative_merge_reports_clean_result(git_repo: Path) -> None:
+    _build_history(
+        git_repo,
+        {"base.txt": "seed\n"},
+        feature={"feature.txt": "feature\n"},
+        main={"main.txt": "main\n"},
+    )
 
     result = speculative_merge_check(git_repo, "main", "feature")
 
@@ -67,17 +153,12 @@ def test_speculative_merge_reports_clean_result(git_repo: Path) -> None:
 
 
 def test_speculative_merge_reports_conflicts(git_repo: Path) -> None:
-    (git_repo / "shared.txt").write_text("alpha\n", encoding="utf-8")
-    _run_git("add", "shared.txt", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "shared.txt").write_text("feature change\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "shared.txt").write_text("main change\n", encoding="utf-8")
-    _run_git("commit", "-am", "main", cwd=git_repo)
+    _build_history(
+        git_repo,
+        {"shared.txt": "alpha\n"},
+        feature={"shared.txt": "feature change\n"},
+        main={"shared.txt": "main change\n"},
+    )
 
     result = speculative_merge_check(git_repo, "main", "feature")
 
@@ -89,17 +170,12 @@ def test_speculative_merge_reports_conflicts(git_repo: Path) -> None:
 
 
 def test_speculative_merge_reports_delete_vs_modify_conflict(git_repo: Path) -> None:
-    (git_repo / "shared.txt").write_text("alpha\n", encoding="utf-8")
-    _run_git("add", "shared.txt", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "shared.txt").write_text("feature\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "shared.txt").unlink()
-    _run_git("commit", "-am", "delete", cwd=git_repo)
+    _build_history(
+        git_repo,
+        {"shared.txt": "alpha\n"},
+        feature={"shared.txt": "feature\n"},
+        main={"shared.txt": None},
+    )
 
     result = speculative_merge_check(git_repo, "main", "feature")
 
@@ -111,23 +187,12 @@ def test_speculative_merge_reports_delete_vs_modify_conflict(git_repo: Path) ->
 
 
 def test_speculative_merge_classifies_comment_only_conflicts(git_repo: Path) -> None:
-    (git_repo / "notes.py").write_text("# seed\nvalue = 1\n", encoding="utf-8")
-    _run_git("add", "notes.py", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "notes.py").write_text(
-        "# feature comment\nvalue = 1\n",
-        encoding="utf-8",
+    _build_history(
+        git_repo,
+        {"notes.py": "# seed\nvalue = 1\n"},
+        feature={"notes.py": "# feature comment\nvalue = 1\n"},
+        main={"notes.py": "# main comment\nvalue = 1\n"},
     )
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "notes.py").write_text(
-        "# main comment\nvalue = 1\n",
-        encoding="utf-8",
-    )
-    _run_git("commit", "-am", "main", cwd=git_repo)
 
     result = speculative_merge_check(git_repo, "main", "feature")
 
@@ -141,17 +206,12 @@ def test_speculative_merge_classifies_comment_only_conflicts(git_repo: Path) ->
 
 
 def test_speculative_merge_classifies_code_conflicts(git_repo: Path) -> None:
-    (git_repo / "app.py").write_text("value = 1\n", encoding="utf-8")
-    _run_git("add", "app.py", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "app.py").write_text("value = 2\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "app.py").write_text("value = 3\n", encoding="utf-8")
-    _run_git("commit", "-am", "main", cwd=git_repo)
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
 
     result = speculative_merge_check(git_repo, "main", "feature")
 
@@ -164,25 +224,445 @@ def test_speculative_merge_classifies_code_conflicts(git_repo: Path) -> None:
     assert result.get("auto_resolvable") is False
 
 
-def test_classify_conflicts_marks_missing_files_unknown(tmp_path: Path) -> None:
-    from axel import merge as merge_module
+@pytest.mark.parametrize(
+    ("feature", "main", "expected_files"),
+    [
+        ({"app.py": "value = 2\n"}, {"app.py": "value = 3\n"}, ["app.py"]),
+        ({"feature.txt": "feature\n"}, {"main.txt": "main\n"}, []),
+        ({"my app.py": "value = 2\n"}, {"my app.py": "value = 3\n"}, ["my app.py"]),
+    ],
+)
+def test_speculative_merge_falls_back_to_worktree(
+    git_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    feature: dict[str, str],
+    main: dict[str, str],
+    expected_files: list[str],
+) -> None:
+    _build_history(git_repo, {"app.py": "value = 1\n"}, feature=feature, main=main)
+    commands: list[str] = []
+    original = merge_module._run_git
+
+    def _fake_run_git(*args: str, **kwargs: object):
+        commands.append(args[0])
+        if args[0] == "merge-tree":
+            # Mimic Git < 2.38, which rejects --write-tree with a usage error.
+            return subprocess.CompletedProcess(["git", *args], 129, "", "usage")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(merge_module, "_run_git", _fake_run_git)
+
+    result = speculative_merge_check(git_repo, "main", "feature")
+
+    assert "worktree" in commands
+    assert result["conflicts"] is bool(expected_files)
+    assert result["conflicted_files"] == expected_files
+    if expected_files:
+        assert result["conflict_classification"] == dict.fromkeys(
+            expected_files, "code"
+        )
+
+
+def test_unmerged_paths_skips_rename_sources() -> None:
+    status = "\0".join(
+        [
+            "2 R. N... 100644 100644 100644 a b R100 new.txt",
+            "u old.txt",
+            "u UU N... 100644 100644 100644 100644 a b c dir/my file.txt",
+            "? untracked.txt",
+            "",
+        ]
+    )
+
+    assert merge_module._unmerged_paths(status) == ["dir/my file.txt"]
+
+
+def test_classify_tree_conflicts_marks_unreadable_entries_unknown(
+    git_repo: Path,
+) -> None:
+    _build_history(
+        git_repo,
+        {"infra/config.yml": "value: 1\n"},
+        feature={},
+        main={},
+    )
+
+    assert merge_module._classify_tree_conflicts(git_repo, "main^{tree}", []) == {}
+    assert merge_module._classify_tree_conflicts(
+        git_repo, "main^{tree}", ["missing.txt", "infra", "infra/config.yml"]
+    ) == {"missing.txt": "unknown", "infra": "unknown", "infra/config.yml": "unknown"}
+
+
+def test_speculative_merge_check_many_matches_single_checks(git_repo: Path) -> None:
+    _build_history(
+        git_repo,
+        {"notes.py": "# seed\nvalue = 1\n", "app.py": "value = 1\n"},
+        feature={"notes.py": "# feature\nvalue = 1\n", "extra.txt": "new\n"},
+        main={"notes.py": "# main\nvalue = 1\n"},
+    )
+    pairs = [("main", "feature"), ("main", "main~1"), ("feature", "main")]
+
+    results = speculative_merge_check_many(git_repo, pairs)
+
+    assert results == [
+        speculative_merge_check(git_repo, base, head) for base, head in pairs
+    ]
+    assert [result["conflicts"] for result in results] == [True, False, True]
+    assert results[0]["conflict_classification"] == {"notes.py": "comment_only"}
+
+
+def test_speculative_merge_check_many_uses_one_merge_tree_process(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
+    commands: list[tuple[str, ...]] = []
+    original = merge_module._run_git
+
+    def _recording_run_git(*args: str, **kwargs: object):
+        commands.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(merge_module, "_run_git", _recording_run_git)
+
+    results = speculative_merge_check_many(git_repo, [("main", "feature")] * 50)
+
+    assert len(results) == 50
+    assert all(result["conflicted_files"] == ["app.py"] for result in results)
+    assert sum(1 for args in commands if args[0] == "merge-tree") == 1
+
+
+@pytest.mark.parametrize(
+    "stdin_result",
+    [
+        subprocess.CompletedProcess([], 129, "", "unknown option `stdin'"),
+        subprocess.CompletedProcess([], 0, "-1\0", ""),
+    ],
+)
+def test_speculative_merge_check_many_falls_back_per_pair(
+    git_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    stdin_result: subprocess.CompletedProcess[str],
+) -> None:
+    _build_history(
+        git_repo,
+        {"base.txt": "seed\n"},
+        feature={"feature.txt": "feature\n"},
+        main={"main.txt": "main\n"},
+    )
+    original = merge_module._run_git
+
+    def _fake_run_git(*args: str, **kwargs: object):
+        if "--stdin" in args:
+            return stdin_result
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(merge_module, "_run_git", _fake_run_git)
+
+    results = speculative_merge_check_many(git_repo, [("main", "feature")])
+
+    assert results == [speculative_merge_check(git_repo, "main", "feature")]
+
+
+def test_speculative_merge_check_many_handles_empty_batch(git_repo: Path) -> None:
+    assert speculative_merge_check_many(git_repo, []) == []
+
+
+@pytest.fixture()
+def pipe_timeout() -> Iterator[None]:
+    """Fail a test instead of stalling if a long-lived git pipe stops answering."""
+
+    def _expire(signum: int, frame: object) -> None:
+        raise TimeoutError("git pipe round trip timed out")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.alarm(30)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def test_merge_daemon_reuses_two_git_processes(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch, pipe_timeout: None
+) -> None:
+    _build_history(
+        git_repo,
+        {"notes.py": "# seed\nvalue = 1\n", "app.py": "value = 1\n"},
+        feature={"notes.py": "# feature\nvalue = 1\n", "app.py": "value = 2\n"},
+        main={"notes.py": "# main\nvalue = 1\n", "app.py": "value = 3\n"},
+    )
+    pairs = [("main", "feature"), ("main", "main")] * 5
+    expected = [speculative_merge_check(git_repo, base, head) for base, head in pairs]
+
+    spawned: list[str] = []
+    real_popen = subprocess.Popen
+
+    class _CountingPopen(real_popen):  # type: ignore[misc, valid-type]
+        def __init__(self, args: list[str], *rest: object, **kwargs: object) -> None:
+            spawned.append(args[1])
+            super().__init__(args, *rest, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", _CountingPopen)
+
+    with MergeDaemon(git_repo) as daemon:
+        results = [daemon.check(base, head) for base, head in pairs]
+
+    assert results == expected
+    assert results[0]["conflict_summary"] == {"comment_only": 1, "code": 1}
+    # rev-parse locates the repository; every check then reuses the helpers.
+    assert spawned == ["rev-parse", "cat-file", "merge-tree"]
+
+
+def test_merge_daemon_rejects_unknown_revision(
+    git_repo: Path, pipe_timeout: None
+) -> None:
+    _build_history(git_repo, {"a.txt": "a\n"}, feature={}, main={})
+    daemon = MergeDaemon(git_repo)
+
+    with pytest.raises(ValueError, match="Unknown revision: missing"):
+        daemon.check("main", "missing")
+
+    daemon.close()
+    daemon.close()
+    with pytest.raises(ValueError, match="closed"):
+        daemon.check("main", "feature")
+
+
+def test_merge_daemon_falls_back_when_merge_tree_stdin_fails(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch, pipe_timeout: None
+) -> None:
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
+    # Mimic Git < 2.38, where merge-tree exits at once on unknown options.
+    monkeypatch.setattr(
+        merge_module, "_MERGE_TREE_STDIN_ARGS", ("merge-tree", "--no-such-option")
+    )
+
+    with MergeDaemon(git_repo) as daemon:
+        first = daemon.check("main", "feature")
+        second = daemon.check("main", "feature")
+
+    expected = speculative_merge_check(git_repo, "main", "feature")
+    assert first == expected
+    assert second == expected
+
+
+def test_merge_daemon_falls_back_when_cat_file_exits(
+    git_repo: Path, pipe_timeout: None
+) -> None:
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
+    expected = speculative_merge_check(git_repo, "main", "feature")
+
+    with MergeDaemon(git_repo) as daemon:
+        assert daemon.check("main", "feature") == expected
+        daemon._objects.kill()
+        daemon._objects.wait()
+        assert daemon.check("main", "feature") == expected
+        with pytest.raises(ValueError, match="Unknown revision: missing"):
+            daemon.check("main", "missing")
+
+
+class _FakeHelper:
+    """Stand-in for a git helper process whose output is fixed up front."""
+
+    def __init__(self, output: bytes) -> None:
+        self.stdin = io.BytesIO()
+        self.stdout = io.BufferedReader(io.BytesIO(output))  # type: ignore[arg-type]
+
+    def wait(self) -> int:
+        return 0
+
+
+@pytest.mark.parametrize(
+    ("helper", "output"),
+    [
+        ("merge-tree", b""),
+        ("merge-tree", b"2\0"),
+        ("merge-tree", b"1\0tree\0\0\0" + b"0\0tree\0\0"),
+        ("cat-file", b""),
+    ],
+)
+def test_merge_daemon_falls_back_on_unexpected_helper_output(
+    git_repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    pipe_timeout: None,
+    helper: str,
+    output: bytes,
+) -> None:
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
+    original = MergeDaemon._spawn
+
+    def _spawn(self: MergeDaemon, *args: str) -> object:
+        if args[0] == helper:
+            return _FakeHelper(output)
+        return original(self, *args)
+
+    monkeypatch.setattr(MergeDaemon, "_spawn", _spawn)
+
+    with MergeDaemon(git_repo) as daemon:
+        result = daemon.check("main", "feature")
+
+    assert result == speculative_merge_check(git_repo, "main", "feature")
+
+
+def test_merge_daemon_stops_cat_file_when_merge_tree_cannot_start(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spawned: list[subprocess.Popen[bytes]] = []
+    original = MergeDaemon._spawn
+
+    def _spawn(self: MergeDaemon, *args: str) -> subprocess.Popen[bytes]:
+        if args[0] == "merge-tree":
+            raise FileNotFoundError("git")
+        spawned.append(original(self, *args))
+        return spawned[-1]
 
+    monkeypatch.setattr(MergeDaemon, "_spawn", _spawn)
+
+    with pytest.raises(FileNotFoundError):
+        MergeDaemon(git_repo)
+
+    assert [process.returncode for process in spawned] == [0]
+
+
+def test_merge_cli_checks_batch_file(
+    git_repo: Path, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    _build_history(
+        git_repo,
+        {"shared.txt": "seed\n"},
+        feature={"shared.txt": "feature\n"},
+        main={},
+    )
+    batch = tmp_path / "pairs.txt"
+    batch.write_text("# base head\nmain feature\n\nfeature main\n", encoding="utf-8")
+
+    exit_code = merge_module.main(
+        ["check", "--repo", str(git_repo), "--batch", str(batch), "--json"]
+    )
+    payload = json.loads(capfd.readouterr().out)
+
+    assert exit_code == 0
+    assert [(entry["base"], entry["head"]) for entry in payload] == [
+        ("main", "feature"),
+        ("feature", "main"),
+    ]
+
+    exit_code = merge_module.main(
+        ["check", "--repo", str(git_repo), "--batch", str(batch)]
+    )
+
+    assert exit_code == 0
+    assert capfd.readouterr().out.count("Merge is clean") == 2
+
+
+def test_merge_cli_keep_repo_streams_batch(
+    git_repo: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    pipe_timeout: None,
+) -> None:
+    _build_history(
+        git_repo,
+        {"app.py": "value = 1\n"},
+        feature={"app.py": "value = 2\n"},
+        main={"app.py": "value = 3\n"},
+    )
+    batch = tmp_path / "pairs.txt"
+    batch.write_text("main feature\nmain main\n", encoding="utf-8")
+    args = ["check", "--repo", str(git_repo), "--batch", str(batch)]
+
+    assert merge_module.main(args) == 1
+    expected_text = capfd.readouterr().out
+    assert merge_module.main([*args, "--keep-repo"]) == 1
+    assert capfd.readouterr().out == expected_text
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("main main\n"))
+    exit_code = merge_module.main(
+        ["check", "--repo", str(git_repo), "--batch", "-", "--keep-repo", "--json"]
+    )
+    lines = capfd.readouterr().out.splitlines()
+
+    assert exit_code == 0
+    assert [json.loads(line)["conflicts"] for line in lines] == [False]
+
+
+def test_merge_cli_keep_repo_requires_batch(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit):
+        merge_module.main(["check", "--base", "main", "--head", "x", "--keep-repo"])
+
+    assert "--keep-repo requires --batch" in capsys.readouterr().err
+
+
+def test_merge_cli_rejects_malformed_batch_line(
+    git_repo: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    batch = tmp_path / "pairs.txt"
+    batch.write_text("main\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        merge_module.main(["check", "--repo", str(git_repo), "--batch", str(batch)])
+
+    assert "BASE HEAD" in capsys.readouterr().err
+
+
+def test_merge_cli_rejects_batch_with_base_or_head(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    batch = tmp_path / "pairs.txt"
+    batch.write_text("main feature\n", encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        merge_module.main(["check", "--batch", str(batch), "--base", "main"])
+
+    assert "--batch cannot be combined" in capsys.readouterr().err
+
+
+def test_merge_cli_requires_base_and_head_without_batch(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit):
+        merge_module.main(["check", "--base", "main"])
+
+    assert "--batch" in capsys.readouterr().err
+
+
+def test_classify_conflicts_marks_missing_files_unknown(tmp_path: Path) -> None:
     classifications = merge_module._classify_conflicts(tmp_path, ["missing.txt"])
 
     assert classifications["missing.txt"] == "unknown"
 
 
 def test_classify_segments_handles_html_comments() -> None:
-    from axel import merge as merge_module
-
     result = merge_module._classify_segments([(["<!-- note -->"], ["<!-- alt -->"])])
 
     assert result == "comment_only"
 
 
-def test_extract_conflict_segments_handles_blank_lines(tmp_path: Path) -> None:
-    from axel import merge as merge_module
-
+def test_extract_conflict_segments_handles_blank_lines() -> None:
     content = (
         "<<<<<<< ours\n"
         "# comment\n"
@@ -192,32 +672,25 @@ def test_extract_conflict_segments_handles_blank_lines(tmp_path: Path) -> None:
         "\n"
         ">>>>>>> theirs\n"
     )
-    file_path = tmp_path / "conflict.txt"
-    file_path.write_text(content, encoding="utf-8")
-
-    segments = merge_module._extract_conflict_segments(
-        file_path.read_text(encoding="utf-8")
-    )
+    segments = merge_module._extract_conflict_segments(content)
 
     assert segments == [(["# comment", ""], ["# alt", ""])]
 
 
-def test_classify_segments_returns_unknown_for_empty_segments() -> None:
-    from axel import merge as merge_module
+def test_extract_conflict_segments_skips_content_without_markers() -> None:
+    assert merge_module._extract_conflict_segments("=======\n>>>>>>> theirs\n") == []
+
 
+def test_classify_segments_returns_unknown_for_empty_segments() -> None:
     assert merge_module._classify_segments([]) == "unknown"
 
 
 def test_is_comment_line_handles_blank_and_html() -> None:
-    from axel import merge as merge_module
-
     assert merge_module._is_comment_line("   ")
     assert merge_module._is_comment_line("<!-- reminder -->")
 
 
 def test_prune_common_lines_removes_shared_entries() -> None:
-    from axel import merge as merge_module
-
     ours_unique, theirs_unique = merge_module._prune_common_lines(
         ["# main", "value"],
         ["# feature", "value"],
@@ -227,17 +700,41 @@ def test_prune_common_lines_removes_shared_entries() -> None:
     assert theirs_unique == ["# feature"]
 
 
-def test_classify_segments_skips_identical_chunks() -> None:
-    from axel import merge as merge_module
+def test_prune_common_lines_respects_duplicate_counts() -> None:
+    ours_unique, theirs_unique = merge_module._prune_common_lines(
+        ["value", "value", "# main"],
+        ["value", "# feature"],
+    )
+
+    assert ours_unique == ["value", "# main"]
+    assert theirs_unique == ["# feature"]
+
+
+def test_prune_common_lines_returns_disjoint_segments_unchanged() -> None:
+    assert merge_module._prune_common_lines(("# main",), ("# feature",)) == (
+        ["# main"],
+        ["# feature"],
+    )
 
+
+def test_classify_segments_skips_identical_chunks() -> None:
     result = merge_module._classify_segments([(["value"], ["value"])])
 
     assert result == "comment_only"
 
 
-def test_format_result_lists_conflicted_files() -> None:
-    from axel import merge as merge_module
+def test_classify_segments_memoizes_repeated_segments() -> None:
+    merge_module._segment_is_comment_only.cache_clear()
+    segment = (["# license header"], ["# licence header"])
+
+    assert merge_module._classify_segments([segment]) == "comment_only"
+    assert merge_module._classify_segments([segment]) == "comment_only"
 
+    info = merge_module._segment_is_comment_only.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_format_result_lists_conflicted_files() -> None:
     text = merge_module._format_result(
         "main", "feature", {"conflicts": True, "conflicted_files": ["foo.txt"]}
     )
@@ -247,8 +744,6 @@ def test_format_result_lists_conflicted_files() -> None:
 
 
 def test_format_result_reports_clean_merge() -> None:
-    from axel import merge as merge_module
-
     text = merge_module._format_result(
         "main", "feature", {"conflicts": False, "conflicted_files": []}
     )
@@ -256,26 +751,21 @@ def test_format_result_reports_clean_merge() -> None:
     assert "clean" in text.lower()
 
 
-def test_merge_cli_outputs_json(tmp_path, capsys) -> None:
-    import json
-
-    from axel import merge as merge_module
-
-    repo = _init_repo(tmp_path / "cli-clean")
-    (repo / "base.txt").write_text("seed\n", encoding="utf-8")
-    _run_git("add", "base.txt", cwd=repo)
-    _run_git("commit", "-m", "initial", cwd=repo)
-    _run_git("checkout", "-b", "feature", cwd=repo)
-    (repo / "feature.txt").write_text("feature\n", encoding="utf-8")
-    _run_git("add", "feature.txt", cwd=repo)
-    _run_git("commit", "-m", "feature", cwd=repo)
-    _run_git("checkout", "main", cwd=repo)
+def test_merge_cli_outputs_json(
+    git_repo: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    _build_history(
+        git_repo,
+        {"base.txt": "seed\n"},
+        feature={"feature.txt": "feature\n"},
+        main={},
+    )
 
     exit_code = merge_module.main(
         [
             "check",
             "--repo",
-            str(repo),
+            str(git_repo),
             "--base",
             "main",
             "--head",
@@ -283,7 +773,7 @@ def test_merge_cli_outputs_json(tmp_path, capsys) -> None:
             "--json",
         ]
     )
-    captured = capsys.readouterr()
+    captured = capfd.readouterr()
     payload = json.loads(captured.out)
 
     assert exit_code == 0
@@ -291,40 +781,34 @@ def test_merge_cli_outputs_json(tmp_path, capsys) -> None:
     assert payload["conflicted_files"] == []
 
 
-def test_merge_cli_reports_conflicts(tmp_path, capsys) -> None:
-    from axel import merge as merge_module
-
-    repo = _init_repo(tmp_path / "cli-conflict")
-    (repo / "shared.txt").write_text("seed\n", encoding="utf-8")
-    _run_git("add", "shared.txt", cwd=repo)
-    _run_git("commit", "-m", "initial", cwd=repo)
-    _run_git("checkout", "-b", "feature", cwd=repo)
-    (repo / "shared.txt").write_text("feature\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=repo)
-    _run_git("checkout", "main", cwd=repo)
-    (repo / "shared.txt").write_text("main\n", encoding="utf-8")
-    _run_git("commit", "-am", "main", cwd=repo)
+def test_merge_cli_reports_conflicts(
+    git_repo: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    _build_history(
+        git_repo,
+        {"shared.txt": "seed\n"},
+        feature={"shared.txt": "feature\n"},
+        main={"shared.txt": "main\n"},
+    )
 
     exit_code = merge_module.main(
         [
             "check",
             "--repo",
-            str(repo),
+            str(git_repo),
             "--base",
             "main",
             "--head",
             "feature",
         ]
     )
-    captured = capsys.readouterr()
+    captured = capfd.readouterr()
 
     assert exit_code == 1
     assert "conflict" in captured.out.lower()
 
 
 def test_merge_cli_requires_command(capsys) -> None:
-    from axel import merge as merge_module
-
     exit_code = merge_module.main([])
     captured = capsys.readouterr()
 
@@ -335,17 +819,12 @@ def test_merge_cli_requires_command(capsys) -> None:
 def test_plan_merge_actions_auto_resolves_comment_conflicts(git_repo: Path) -> None:
     """Comment-only conflicts should auto-resolve per policy heuristics."""
 
-    (git_repo / "notes.py").write_text("# seed\nvalue = 1\n", encoding="utf-8")
-    _run_git("add", "notes.py", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    (git_repo / "notes.py").write_text("# feature\nvalue = 1\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    (git_repo / "notes.py").write_text("# main\nvalue = 1\n", encoding="utf-8")
-    _run_git("commit", "-am", "main", cwd=git_repo)
+    _build_history(
+        git_repo,
+        {"notes.py": "# seed\nvalue = 1\n"},
+        feature={"notes.py": "# feature\nvalue = 1\n"},
+        main={"notes.py": "# main\nvalue = 1\n"},
+    )
 
     plan = plan_merge_actions(git_repo, "main", "feature")
 
@@ -360,19 +839,12 @@ def test_plan_merge_actions_auto_resolves_comment_conflicts(git_repo: Path) -> N
 def test_plan_merge_actions_uses_priority_rules(git_repo: Path) -> None:
     """Priority rules should steer resolutions for matching paths."""
 
-    (git_repo / "infra").mkdir()
-    config = git_repo / "infra" / "config.yml"
-    config.write_text("value: 1\n", encoding="utf-8")
-    _run_git("add", "infra/config.yml", cwd=git_repo)
-    _run_git("commit", "-m", "initial", cwd=git_repo)
-
-    _run_git("checkout", "-b", "feature", cwd=git_repo)
-    config.write_text("value: feature\n", encoding="utf-8")
-    _run_git("commit", "-am", "feature", cwd=git_repo)
-
-    _run_git("checkout", "main", cwd=git_repo)
-    config.write_text("value: main\n", encoding="utf-8")
-    _run_git("commit", "-am", "main", cwd=git_repo)
+    _build_history(
+        git_repo,
+        {"infra/config.yml": "value: 1\n"},
+        feature={"infra/config.yml": "value: feature\n"},
+        main={"infra/config.yml": "value: main\n"},
+    )
 
     plan = plan_merge_actions(git_repo, "main", "feature")
 
@@ -381,9 +853,49 @@ def test_plan_merge_actions_uses_priority_rules(git_repo: Path) -> None:
     assert plan.resolutions.get("infra/config.yml") == "main_wins"
 
 
-def test_auto_resolvable_false_for_conflicts_without_summary() -> None:
-    from axel import merge as merge_module
+def test_plan_merge_actions_many_matches_single_plans(git_repo: Path) -> None:
+    _build_history(
+        git_repo,
+        {"notes.py": "# seed\nvalue = 1\n", "infra/config.yml": "value: 1\n"},
+        feature={"notes.py": "# feature\nvalue = 1\n"},
+        main={"infra/config.yml": "value: main\n"},
+    )
+    pairs = [("main", "feature"), ("feature", "main~1")]
+
+    plans = plan_merge_actions_many(git_repo, pairs)
 
+    assert plans == [plan_merge_actions(git_repo, base, head) for base, head in pairs]
+    assert [plan.head for plan in plans] == ["feature", "main~1"]
+
+
+def test_plan_merge_actions_many_loads_policy_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    policy_loads: list[object] = []
+    batches: list[list[tuple[str, str]]] = []
+
+    def _fake_policy(path: Path | str | None = None) -> dict[str, object]:
+        policy_loads.append(path)
+        return {}
+
+    def _fake_many(
+        repo_path: Path | str, pairs: list[tuple[str, str]]
+    ) -> list[dict[str, object]]:
+        batches.append(pairs)
+        return [{"conflicts": False, "auto_resolvable": True} for _ in pairs]
+
+    monkeypatch.setattr("axel.merge.load_merge_policy", _fake_policy)
+    monkeypatch.setattr("axel.merge.speculative_merge_check_many", _fake_many)
+
+    pairs = [("main", f"feature-{index}") for index in range(10)]
+    plans = plan_merge_actions_many(".", iter(pairs))
+
+    assert len(policy_loads) == 1
+    assert batches == [pairs]
+    assert all(plan.auto_resolve for plan in plans)
+
+
+def test_auto_resolvable_false_for_conflicts_without_summary() -> None:
     assert merge_module._auto_resolvable({}, conflicts=True) is False
 
 
@@ -402,6 +914,32 @@ def test_load_merge_policy_returns_empty_for_blank_file(tmp_path: Path) -> None:
     assert load_merge_policy(empty) == {}
 
 
+def test_load_merge_policy_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text("merge_policy: {}\n", encoding="utf-8")
+    calls: list[str] = []
+    original = merge_module.yaml.safe_load
+
+    def _counting_load(text: str) -> object:
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(merge_module.yaml, "safe_load", _counting_load)
+
+    first = load_merge_policy(policy_file)
+    first["mutated"] = True
+    first["merge_policy"]["nested"] = True
+    assert load_merge_policy(policy_file) == {"merge_policy": {}}
+    assert len(calls) == 1
+
+    policy_file.write_text("merge_policy: {metadata: {}}\n", encoding="utf-8")
+
+    assert load_merge_policy(policy_file) == {"merge_policy": {"metadata": {}}}
+    assert len(calls) == 2
+
+
 def test_plan_merge_actions_handles_non_mapping_classifications(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -422,19 +960,25 @@ def test_plan_merge_actions_handles_non_mapping_classifications(
     assert plan.resolutions == {}
 
 
+# Read-only so the planner is also checked not to mutate the policy it receives.
+_POLICY_FALLBACK_FIXTURE = MappingProxyType(
+    {
+        "merge_policy": MappingProxyType(
+            {
+                "conflict_resolution": {"fallback": "manual_review"},
+                "metadata": "string",  # triggers defensive branch
+                "safety_checks": ({"command": "pytest"},),
+            }
+        )
+    }
+)
+
+
 def test_plan_merge_actions_uses_fallback_and_metadata_defaults(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    policy = {
-        "merge_policy": {
-            "conflict_resolution": {"fallback": "manual_review"},
-            "metadata": "string",  # triggers defensive branch
-            "safety_checks": [{"command": "pytest"}],
-        }
-    }
-
-    def _fake_policy(path: Path | str | None = None) -> dict[str, object]:
-        return policy
+    def _fake_policy(path: Path | str | None = None) -> Mapping[str, object]:
+        return _POLICY_FALLBACK_FIXTURE
 
     def _fake_spec(repo_path: Path | str, base: str, head: str) -> dict[str, object]:
         return {
@@ -1,33 +1,45 @@
 from __future__ import annotations
 
-import subprocess
-import sys
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
+import axel.quests as quests
+import axel.token_place as token_place
+from axel.quests import main, suggest_cross_repo_quests
 
-@pytest.fixture(autouse=True)
-def _reset_token_place_cache() -> None:
-    """Ensure token.place model cache stays isolated per test."""
+_THREE_REPOS = (
+    "https://github.com/futuroptimist/axel",
+    "https://github.com/futuroptimist/gabriel",
+    "https://github.com/futuroptimist/token.place",
+)
+_TOKEN_PLACE_AND_DSPACE = (
+    "https://github.com/futuroptimist/token.place",
+    "https://github.com/futuroptimist/dspace",
+)
 
-    import axel.token_place as token_place
 
-    token_place._clear_model_cache()
-    yield
-    token_place._clear_model_cache()
+@pytest.fixture(scope="session")
+def three_repo_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only repo list shared by the CLI tests that expect suggestions."""
 
+    path = tmp_path_factory.mktemp("quests") / "repos.txt"
+    path.write_text("\n".join(_THREE_REPOS) + "\n", encoding="utf-8")
+    return path
 
-def test_suggest_cross_repo_quests_links_repos() -> None:
-    from axel.quests import suggest_cross_repo_quests
 
-    repos = [
-        "https://github.com/futuroptimist/axel",
-        "https://github.com/futuroptimist/gabriel",
-        "https://github.com/futuroptimist/token.place",
-    ]
+@pytest.fixture(scope="session")
+def single_repo_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only repo list with one entry, which yields no suggestions."""
+
+    path = tmp_path_factory.mktemp("quests") / "repos.txt"
+    path.write_text("https://github.com/futuroptimist/axel\n", encoding="utf-8")
+    return path
 
-    suggestions = suggest_cross_repo_quests(repos, limit=2)
+
+def test_suggest_cross_repo_quests_links_repos() -> None:
+    suggestions = suggest_cross_repo_quests(_THREE_REPOS, limit=2)
 
     assert len(suggestions) == 2
     first = suggestions[0]
@@ -38,21 +50,12 @@ def test_suggest_cross_repo_quests_links_repos() -> None:
 
 
 def test_suggest_cross_repo_quests_mentions_gabriel_for_sensitive_pairs() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
-    repos = [
-        "https://github.com/futuroptimist/token.place",
-        "https://github.com/futuroptimist/dspace",
-    ]
-
-    suggestions = suggest_cross_repo_quests(repos, limit=1)
+    suggestions = suggest_cross_repo_quests(_TOKEN_PLACE_AND_DSPACE, limit=1)
 
     assert "gabriel" in suggestions[0]["details"].lower()
 
 
 def test_suggest_cross_repo_quests_prioritizes_token_template() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     repos = [
         "https://github.com/futuroptimist/token.place",
         "https://github.com/futuroptimist/blog",
@@ -68,9 +71,6 @@ def test_suggest_cross_repo_quests_prioritizes_token_template() -> None:
 def test_suggest_cross_repo_quests_enriches_token_place_with_models(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import axel.token_place as token_place
-    from axel.quests import suggest_cross_repo_quests
-
     monkeypatch.setattr(
         token_place,
         "list_models",
@@ -80,12 +80,7 @@ def test_suggest_cross_repo_quests_enriches_token_place_with_models(
         ],
     )
 
-    repos = [
-        "https://github.com/futuroptimist/token.place",
-        "https://github.com/futuroptimist/dspace",
-    ]
-
-    suggestions = suggest_cross_repo_quests(repos, limit=1)
+    suggestions = suggest_cross_repo_quests(_TOKEN_PLACE_AND_DSPACE, limit=1)
     details = suggestions[0]["details"].lower()
 
     assert "llama-3-8b-instruct" in details
@@ -95,9 +90,6 @@ def test_suggest_cross_repo_quests_enriches_token_place_with_models(
 def test_suggest_cross_repo_quests_handles_token_place_errors(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import axel.token_place as token_place
-    from axel.quests import suggest_cross_repo_quests
-
     def boom(**_: object) -> list[str]:  # pragma: no cover - helper
         raise token_place.TokenPlaceError("offline")
 
@@ -118,8 +110,6 @@ def test_suggest_cross_repo_quests_handles_token_place_errors(
 def test_suggest_cross_repo_quests_forwards_token_place_config(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import axel.quests as quests
-
     captured: dict[str, tuple[str | None, str | None]] = {}
 
     def fake_detail(
@@ -135,13 +125,8 @@ def test_suggest_cross_repo_quests_forwards_token_place_config(
 
     monkeypatch.setattr(quests.token_place_integration, "quest_detail", fake_detail)
 
-    repos = [
-        "https://github.com/futuroptimist/token.place",
-        "https://github.com/futuroptimist/dspace",
-    ]
-
     suggestions = quests.suggest_cross_repo_quests(
-        repos,
+        _TOKEN_PLACE_AND_DSPACE,
         limit=1,
         token_place_base_url="https://token.place/api/v1",
         token_place_api_key="secret",
@@ -158,9 +143,6 @@ def test_suggest_cross_repo_quests_forwards_token_place_config(
 def test_suggest_cross_repo_quests_includes_featured_model_in_summary(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import axel.token_place as token_place
-    from axel.quests import suggest_cross_repo_quests
-
     monkeypatch.setattr(
         token_place,
         "list_models",
@@ -170,12 +152,7 @@ def test_suggest_cross_repo_quests_includes_featured_model_in_summary(
         ],
     )
 
-    repos = [
-        "https://github.com/futuroptimist/token.place",
-        "https://github.com/futuroptimist/dspace",
-    ]
-
-    suggestions = suggest_cross_repo_quests(repos, limit=1)
+    suggestions = suggest_cross_repo_quests(_TOKEN_PLACE_AND_DSPACE, limit=1)
     summary = suggestions[0]["summary"].lower()
 
     assert "token.place" in summary
@@ -190,47 +167,26 @@ def test_suggest_cross_repo_quests_includes_featured_model_in_summary(
     ],
 )
 def test_suggest_cross_repo_quests_requires_multiple_repos(repos: list[str]) -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     assert suggest_cross_repo_quests(repos) == []
 
 
-def test_cli_prints_suggestions(tmp_path: Path) -> None:
-    repo_file = tmp_path / "repos.txt"
-    repo_file.write_text(
-        "https://github.com/futuroptimist/axel\n"
-        "https://github.com/futuroptimist/gabriel\n"
-        "https://github.com/futuroptimist/token.place\n"
-    )
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.quests",
-            "--path",
-            str(repo_file),
-            "--limit",
-            "1",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
+def test_cli_prints_suggestions(
+    three_repo_file: Path,
+    run_module: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    run_module("axel.quests", "--path", str(three_repo_file), "--limit", "1")
 
-    output = result.stdout.lower()
+    output = capsys.readouterr().out.lower()
     assert "axel" in output
     assert "gabriel" in output
     assert "quest" in output
 
 
 def test_cli_forwards_token_place_configuration(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    import axel.quests as quests
-
     repo_file = tmp_path / "repos.txt"
     repo_file.write_text(
         "https://github.com/futuroptimist/token.place\n"
@@ -269,8 +225,6 @@ def test_cli_forwards_token_place_configuration(
 
 
 def test_suggest_cross_repo_quests_handles_incomplete_urls() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     repos = [
         "https://github.com/futuroptimist/axel",
         "https://example.com/solo",
@@ -286,8 +240,6 @@ def test_suggest_cross_repo_quests_handles_incomplete_urls() -> None:
 
 
 def test_suggest_cross_repo_quests_formats_default_detail() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     repos = [
         "https://github.com/example/alpha",
         "https://github.com/example/beta",
@@ -302,8 +254,6 @@ def test_suggest_cross_repo_quests_formats_default_detail() -> None:
 
 
 def test_suggest_cross_repo_quests_respects_limit_zero() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     repos = [
         "https://github.com/futuroptimist/axel",
         "https://github.com/futuroptimist/gitshelves",
@@ -313,8 +263,6 @@ def test_suggest_cross_repo_quests_respects_limit_zero() -> None:
 
 
 def test_suggest_cross_repo_quests_deduplicates_case_insensitive() -> None:
-    from axel.quests import suggest_cross_repo_quests
-
     repos = [
         "https://github.com/futuroptimist/Axel",
         "https://github.com/futuroptimist/axel",
@@ -327,38 +275,21 @@ def test_suggest_cross_repo_quests_deduplicates_case_insensitive() -> None:
     assert suggestions[0]["repos"] == ["futuroptimist/Axel", "futuroptimist/gitshelves"]
 
 
-def test_cli_handles_no_suggestions(tmp_path: Path) -> None:
-    repo_file = tmp_path / "repos.txt"
-    repo_file.write_text("https://github.com/futuroptimist/axel\n")
-
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.quests",
-            "--path",
-            str(repo_file),
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
-
-    assert "no quests available" in result.stdout.lower()
-
+def test_cli_handles_no_suggestions(
+    single_repo_file: Path,
+    run_module: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    run_module("axel.quests", "--path", str(single_repo_file))
+    stdout = capsys.readouterr().out
 
-def test_main_prints_quests(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-    repo_file = tmp_path / "repos.txt"
-    repo_file.write_text(
-        "https://github.com/futuroptimist/axel\n"
-        "https://github.com/futuroptimist/gabriel\n"
-    )
+    assert "no quests available" in stdout.lower()
 
-    from axel.quests import main
 
-    main(["--path", str(repo_file), "--limit", "1"])
+def test_main_prints_quests(
+    three_repo_file: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    main(["--path", str(three_repo_file), "--limit", "1"])
 
     output = capsys.readouterr().out.lower()
     assert "axel" in output
@@ -367,14 +298,9 @@ def test_main_prints_quests(tmp_path: Path, capsys: pytest.CaptureFixture[str])
 
 
 def test_main_handles_no_suggestions(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    single_repo_file: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    repo_file = tmp_path / "repos.txt"
-    repo_file.write_text("https://github.com/futuroptimist/axel\n")
-
-    from axel.quests import main
-
-    main(["--path", str(repo_file)])
+    main(["--path", str(single_repo_file)])
 
     output = capsys.readouterr().out.lower()
     assert "no quests available" in output
@@ -1,72 +1,60 @@
-from pathlib import Path
+_SECTION_END = "## "
 
 
-def test_readme_marks_llm_quests_complete() -> None:
+def test_readme_marks_llm_quests_complete(readme_line_set: frozenset[str]) -> None:
     """The roadmap should reflect the shipped cross-repo quest helper."""
 
-    readme = Path(__file__).resolve().parents[1] / "README.md"
-    content = readme.read_text(encoding="utf-8")
-
-    assert "- [x] integrate LLM assistants to suggest quests across repos" in content
+    assert (
+        "- [x] integrate LLM assistants to suggest quests across repos"
+        in readme_line_set
+    )
 
 
-def test_readme_marks_gabriel_security_layer_complete() -> None:
+def test_readme_marks_gabriel_security_layer_complete(
+    readme_line_set: frozenset[str],
+) -> None:
     """The roadmap should acknowledge the gabriel security integration."""
 
-    readme = Path(__file__).resolve().parents[1] / "README.md"
-    content = readme.read_text(encoding="utf-8")
-
     expected = (
         "- [x] integrate [`gabriel`](https://github.com/futuroptimist/gabriel) "
         "as a security layer across repos"
     )
-    assert expected in content
+    assert expected in readme_line_set
 
 
-def test_readme_includes_alpha_status_and_supporting_docs() -> None:
+def test_readme_includes_alpha_status_and_supporting_docs(readme_bytes: bytes) -> None:
     """README should surface alpha status and link to supporting docs."""
 
-    readme = Path(__file__).resolve().parents[1] / "README.md"
-    content = readme.read_text(encoding="utf-8")
-
-    assert "Status: Alpha" in content
-    assert "docs/FAQ.md" in content
-    assert "docs/KNOWN_ISSUES.md" in content
+    assert b"Status: Alpha" in readme_bytes
+    assert b"docs/FAQ.md" in readme_bytes
+    assert b"docs/KNOWN_ISSUES.md" in readme_bytes
 
 
-def test_readme_describes_gabriel_as_osint_agent() -> None:
+def test_readme_describes_gabriel_as_osint_agent(readme_bytes: bytes) -> None:
     """README should highlight gabriel's OSINT focus and mission."""
 
-    readme = Path(__file__).resolve().parents[1] / "README.md"
-    content = readme.read_text(encoding="utf-8")
+    assert b"open-source OSINT agent" in readme_bytes
+    assert b"Maslow's hierarchy" in readme_bytes
 
-    assert "open-source OSINT agent" in content
-    assert "Maslow's hierarchy" in content
 
-
-def test_readme_includes_architecture_section_with_diagram() -> None:
+def test_readme_includes_architecture_section_with_diagram(
+    readme_lines: tuple[str, ...], readme_headings: dict[str, int]
+) -> None:
     """README should document architecture with bullets and a diagram."""
 
-    readme = Path(__file__).resolve().parents[1] / "README.md"
-    lines = readme.read_text(encoding="utf-8").splitlines()
-
-    section_start: int | None = None
-    for index, line in enumerate(lines):
-        if line.strip().lower() == "## architecture":
-            section_start = index + 1
-            break
-
-    assert section_start is not None, "Missing architecture section in README.md"
+    heading = readme_headings.get("## architecture")
+    assert heading is not None, "Missing architecture section in README.md"
+    section_start = heading + 1
 
     bullet_count = 0
     has_diagram = False
-    for line in lines[section_start:]:
-        if line.startswith("## "):
+    for line in readme_lines[section_start:]:
+        if line.startswith(_SECTION_END):
             break
         stripped = line.strip()
         if stripped.startswith("- "):
             bullet_count += 1
-        if "```mermaid" in stripped.lower():
+        elif stripped.startswith("```mermaid"):
             has_diagram = True
 
     assert bullet_count >= 3, "Architecture section should list at least three bullets"
@@ -1,34 +1,15 @@
 from __future__ import annotations
 
-from pathlib import Path
 
-
-def test_release_dashboard_marks_quickstart_complete() -> None:
+def test_release_dashboard_marks_quickstart_complete(
+    readme_headings: dict[str, int], dashboard_content: str
+) -> None:
     """Release dashboard should acknowledge the shipped Quickstart workflow."""
 
-    root = Path(__file__).resolve().parents[1]
-    dashboard = (root / "docs" / "RELEASE-READINESS-DASHBOARD.md").read_text(
-        encoding="utf-8"
-    )
-    assert "- [x] Quickstart (≤60s) at top of README" in dashboard
+    assert "- [x] Quickstart (≤60s) at top of README" in dashboard_content
 
-    readme_lines = (root / "README.md").read_text(encoding="utf-8").splitlines()
-    quickstart_index = next(
-        (
-            idx
-            for idx, line in enumerate(readme_lines)
-            if line.strip().lower() == "## quickstart (≤60s)"
-        ),
-        None,
-    )
-    status_index = next(
-        (
-            idx
-            for idx, line in enumerate(readme_lines)
-            if line.strip().lower() == "## status"
-        ),
-        None,
-    )
+    quickstart_index = readme_headings.get("## quickstart (≤60s)")
+    status_index = readme_headings.get("## status")
 
     assert quickstart_index is not None, "README.md must include a Quickstart section"
     assert status_index is not None, "README.md must include a status section"
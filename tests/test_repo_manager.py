@@ -1,48 +1,119 @@
-import importlib
 import json
-import subprocess
-import sys
 from pathlib import Path
+from typing import Callable, Mapping
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))  # noqa: E402
-import pytest  # noqa: E402
-import requests  # noqa: E402
+import pytest
 
-from axel import add_repo, load_repos, remove_repo  # noqa: E402
+from axel import add_repo, load_repos, remove_repo
+from axel import repo_manager as rm
 
 
-def test_add_and_load(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == ["https://example.com/repo"]
+class _Resp:
+    """Minimal ``requests.Response`` stand-in for the GitHub fetch tests."""
 
+    __slots__ = ("_data",)
 
-def test_remove_repo(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    remove_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == []
+    def __init__(self, data: list[dict[str, object]]) -> None:
+        self._data = data
 
+    def json(self) -> list[dict[str, object]]:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+# GitHub API pages served by the fetch tests that expect ``u/a`` and ``u/b``.
+_TWO_REPO_PAGES = {
+    1: [
+        {"html_url": "https://github.com/u/a"},
+        {"html_url": "https://github.com/u/b"},
+    ]
+}
+_TWO_REPO_FILE = "https://github.com/u/a\nhttps://github.com/u/b\n"
+
+
+def _make_fake_get(
+    pages: Mapping[int, list[dict[str, object]]],
+) -> Callable[..., _Resp]:
+    """Return a ``requests.get`` stub that serves ``pages`` by page number."""
+
+    def fake_get(url, headers=None, params=None, timeout=0):
+        return _Resp(pages.get(params.get("page", 1), []))
+
+    return fake_get
+
+
+@pytest.fixture
+def repo_file(tmp_path: Path) -> Path:
+    """Return a not-yet-created ``repos.txt`` path under ``tmp_path``."""
+
+    return tmp_path / "repos.txt"
+
+
+@pytest.fixture(scope="session")
+def readonly_repo_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Write the fixed repo lists that ``load_repos`` tests only read."""
+
+    contents = {
+        "comments": (
+            "https://example.com/a\n"
+            "# comment line\n"
+            "https://example.com/b # trailing comment\n"
+        ),
+        "slash": "https://example.com/repo/\n",
+        "duplicates": (
+            "https://example.com/a\nhttps://example.com/a\nhttps://example.com/b\n"
+        ),
+        "unsorted": "https://example.com/b\nhttps://example.com/a\n",
+    }
+    directory = tmp_path_factory.mktemp("repo_lists")
+    files: dict[str, Path] = {}
+    for name, text in contents.items():
+        files[name] = directory / f"{name}.txt"
+        files[name].write_text(text)
+    return files
+
+
+@pytest.fixture
+def env_repo_file(repo_file: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point ``AXEL_REPO_FILE`` at ``repo_file`` for tests of the default path."""
+
+    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
+    return repo_file
 
-def test_cli_list_with_path(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    result = subprocess.run(
-        [sys.executable, "-m", "axel.repo_manager", "--path", str(file), "list"],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-    )
-    assert "https://example.com/repo" in result.stdout
+
+@pytest.fixture
+def seeded_repo_file(repo_file: Path) -> Path:
+    """Return ``repos.txt`` already listing ``https://example.com/repo``."""
+
+    repo_file.write_text("https://example.com/repo\n")
+    return repo_file
+
+
+def test_add_and_load(repo_file: Path):
+    add_repo("https://example.com/repo", path=repo_file)
+    assert load_repos(path=repo_file) == ["https://example.com/repo"]
+
+
+def test_remove_repo(seeded_repo_file: Path):
+    remove_repo("https://example.com/repo", path=seeded_repo_file)
+    assert load_repos(path=seeded_repo_file) == []
+
+
+def test_cli_list_with_path(
+    seeded_repo_file: Path,
+    run_module: Callable[..., None],
+    capsys: pytest.CaptureFixture[str],
+):
+    run_module("axel.repo_manager", "--path", str(seeded_repo_file), "list")
+    stdout = capsys.readouterr().out
+    assert "https://example.com/repo" in stdout
 
 
 def test_main_list_supports_sampling(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    repo_file: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    from axel import repo_manager
-
-    file = tmp_path / "repos.txt"
     urls = [
         "https://github.com/example/delta",
         "https://github.com/example/alpha",
@@ -50,14 +121,13 @@ def test_main_list_supports_sampling(
         "https://github.com/example/bravo",
     ]
 
-    for url in urls:
-        repo_manager.add_repo(url, path=file)
+    rm.add_repos(urls, path=repo_file)
 
-    repo_manager.main(
+    rm.main(
         [
             "list",
             "--path",
-            str(file),
+            str(repo_file),
             "--sample=2",
             "--seed",
             "7",
@@ -76,32 +146,23 @@ def test_main_list_supports_sampling(
 
 
 def test_main_list_requires_sample_value() -> None:
-    from axel import repo_manager
-
     with pytest.raises(SystemExit):
-        repo_manager.main(["list", "--sample"])
+        rm.main(["list", "--sample"])
 
 
 def test_main_list_requires_seed_value() -> None:
-    from axel import repo_manager
-
     with pytest.raises(SystemExit):
-        repo_manager.main(["list", "--seed"])
+        rm.main(["list", "--seed"])
 
 
 def test_main_list_accepts_seed_equals_form(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    seeded_repo_file: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    from axel import repo_manager
-
-    file = tmp_path / "repos.txt"
-    repo_manager.add_repo("https://example.com/repo", path=file)
-
-    repo_manager.main(
+    rm.main(
         [
             "list",
             "--path",
-            str(file),
+            str(seeded_repo_file),
             "--seed=5",
         ]
     )
@@ -109,57 +170,40 @@ def test_main_list_accepts_seed_equals_form(
     assert "https://example.com/repo" in capsys.readouterr().out
 
 
-def test_main_list_rejects_non_numeric_sample(tmp_path: Path) -> None:
-    from axel import repo_manager
-
-    file = tmp_path / "repos.txt"
-    repo_manager.add_repo("https://example.com/repo", path=file)
-
+def test_main_list_rejects_non_numeric_sample(seeded_repo_file: Path) -> None:
     with pytest.raises(SystemExit):
-        repo_manager.main(
+        rm.main(
             [
                 "list",
                 "--path",
-                str(file),
+                str(seeded_repo_file),
                 "--sample",
                 "oops",
             ]
         )
 
 
-def test_main_add_accepts_path_after_subcommand(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
-) -> None:
-    from axel.repo_manager import main
-
-    file = tmp_path / "repos.txt"
-
-    main(
+def test_main_add_accepts_path_after_subcommand(repo_file: Path) -> None:
+    rm.main(
         [
             "add",
             "https://example.com/repo",
             "--path",
-            str(file),
+            str(repo_file),
         ]
     )
 
-    assert load_repos(path=file) == ["https://example.com/repo"]
-    assert "https://example.com/repo" in capsys.readouterr().out
+    assert load_repos(path=repo_file) == ["https://example.com/repo"]
 
 
 def test_main_list_supports_json_output(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    seeded_repo_file: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    from axel import repo_manager
-
-    repo_file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=repo_file)
-
-    repo_manager.main(
+    rm.main(
         [
             "list",
             "--path",
-            str(repo_file),
+            str(seeded_repo_file),
             "--json",
         ]
     )
@@ -169,30 +213,25 @@ def test_main_list_supports_json_output(
 
 
 def test_main_add_uses_default_repo_file(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    repo_file: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import repo_manager
-
-    default_file = tmp_path / "repos.txt"
-    monkeypatch.setattr(repo_manager, "get_repo_file", lambda: default_file)
+    monkeypatch.setattr(rm, "get_repo_file", lambda: repo_file)
 
-    repo_manager.main(["add", "https://example.com/repo"])
+    rm.main(["add", "https://example.com/repo"])
 
-    assert load_repos(path=default_file) == ["https://example.com/repo"]
+    assert load_repos(path=repo_file) == ["https://example.com/repo"]
 
 
 def test_main_add_supports_path_equals_form(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import repo_manager
-
     home = tmp_path / "home"
     home.mkdir()
     monkeypatch.setenv("HOME", str(home))
 
     target = Path("~") / "nested" / "repos.txt"
 
-    repo_manager.main(
+    rm.main(
         [
             "add",
             "https://example.com/repo",
@@ -205,40 +244,33 @@ def test_main_add_supports_path_equals_form(
 
 
 def test_main_add_accepts_path_before_subcommand(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    repo_file: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import repo_manager
-
     class SneakyStr(str):
         def __eq__(self, other: object) -> bool:
             return False
 
         __hash__ = str.__hash__
 
-    file = tmp_path / "repos.txt"
     argv = [
         SneakyStr("--path"),
-        str(file),
+        str(repo_file),
         "add",
         "https://example.com/repo",
     ]
 
-    repo_manager.main(argv)
+    rm.main(argv)
 
-    assert load_repos(path=file) == ["https://example.com/repo"]
+    assert load_repos(path=repo_file) == ["https://example.com/repo"]
 
 
 def test_main_uses_sys_argv_when_none(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    repo_file: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     import types
 
-    from axel import repo_manager
-
-    file = tmp_path / "repos.txt"
-
     monkeypatch.setattr(
-        repo_manager,
+        rm,
         "sys",
         types.SimpleNamespace(
             argv=[
@@ -246,52 +278,40 @@ def test_main_uses_sys_argv_when_none(
                 "add",
                 "https://example.com/repo",
                 "--path",
-                str(file),
+                str(repo_file),
             ]
         ),
     )
 
-    repo_manager.main(None)
+    rm.main(None)
 
-    assert load_repos(path=file) == ["https://example.com/repo"]
+    assert load_repos(path=repo_file) == ["https://example.com/repo"]
 
 
 def test_main_rejects_path_without_value() -> None:
-    from axel.repo_manager import main
-
     with pytest.raises(SystemExit) as excinfo:
-        main(["add", "https://example.com/repo", "--path"])
+        rm.main(["add", "https://example.com/repo", "--path"])
 
     assert excinfo.value.code != 0
 
 
-def test_cli_remove(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.repo_manager",
-            "--path",
-            str(file),
-            "remove",
-            "https://example.com/repo",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
+def test_cli_remove(seeded_repo_file: Path, run_module: Callable[..., None]):
+    run_module(
+        "axel.repo_manager",
+        "--path",
+        str(seeded_repo_file),
+        "remove",
+        "https://example.com/repo",
     )
-    assert load_repos(path=file) == []
+    assert load_repos(path=seeded_repo_file) == []
 
 
-def test_load_repos_missing_file(tmp_path: Path):
-    file = tmp_path / "missing.txt"
-    assert load_repos(path=file) == []
+def test_load_repos_missing_file(repo_file: Path):
+    assert load_repos(path=repo_file) == []
 
 
 def test_load_repos_auto_fetches_with_github_token(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, repo_file: Path
 ) -> None:
     """Missing repo files trigger an automatic fetch when GitHub tokens exist."""
 
@@ -304,15 +324,11 @@ def test_load_repos_auto_fetches_with_github_token(
         path.write_text("https://example.com/axel\n", encoding="utf-8")
         return ["https://example.com/axel"]
 
-    repo_file = tmp_path / "repos.txt"
-
     monkeypatch.delenv("AXEL_AUTO_FETCH_REPOS", raising=False)
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
     monkeypatch.setenv("GH_TOKEN", "gh-placeholder")
     monkeypatch.setattr("axel.repo_manager.fetch_repos", fake_fetch_repos)
 
-    from axel import repo_manager as rm
-
     repos = rm.load_repos(path=repo_file)
 
     assert repos == ["https://example.com/axel"]
@@ -320,7 +336,7 @@ def test_load_repos_auto_fetches_with_github_token(
 
 
 def test_load_repos_auto_fetch_can_be_disabled(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, repo_file: Path
 ) -> None:
     """Explicitly disabling auto-fetch bypasses GitHub token detection."""
 
@@ -330,14 +346,10 @@ def test_load_repos_auto_fetch_can_be_disabled(
         called["fetch"] = True
         raise AssertionError("fetch_repos should not be called when disabled")
 
-    repo_file = tmp_path / "repos.txt"
-
     monkeypatch.setenv("AXEL_AUTO_FETCH_REPOS", "0")
     monkeypatch.setenv("GH_TOKEN", "gh-placeholder")
     monkeypatch.setattr("axel.repo_manager.fetch_repos", fake_fetch_repos)
 
-    from axel import repo_manager as rm
-
     repos = rm.load_repos(path=repo_file)
 
     assert repos == []
@@ -345,7 +357,7 @@ def test_load_repos_auto_fetch_can_be_disabled(
 
 
 def test_load_repos_auto_fetches_when_enabled(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, repo_file: Path
 ) -> None:
     """Missing repo files trigger an automatic fetch when opt-in is set."""
 
@@ -358,13 +370,9 @@ def test_load_repos_auto_fetches_when_enabled(
         path.write_text("https://example.com/axel\n", encoding="utf-8")
         return ["https://example.com/axel"]
 
-    repo_file = tmp_path / "repos.txt"
-
     monkeypatch.setenv("AXEL_AUTO_FETCH_REPOS", "1")
     monkeypatch.setattr("axel.repo_manager.fetch_repos", fake_fetch_repos)
 
-    from axel import repo_manager as rm
-
     repos = rm.load_repos(path=repo_file)
 
     assert repos == ["https://example.com/axel"]
@@ -372,20 +380,16 @@ def test_load_repos_auto_fetches_when_enabled(
 
 
 def test_load_repos_auto_fetch_handles_errors(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, repo_file: Path
 ) -> None:
     """Auto fetch falls back to an empty list when fetching fails."""
 
     def fake_fetch_repos(*, path: Path | None = None, **_: object) -> list[str]:
         raise RuntimeError("credentials required")
 
-    repo_file = tmp_path / "repos.txt"
-
     monkeypatch.setenv("AXEL_AUTO_FETCH_REPOS", "1")
     monkeypatch.setattr("axel.repo_manager.fetch_repos", fake_fetch_repos)
 
-    from axel import repo_manager as rm
-
     repos = rm.load_repos(path=repo_file)
 
     assert repos == []
@@ -393,8 +397,6 @@ def test_load_repos_auto_fetch_handles_errors(
 
 
 def test_apply_sampling_edge_cases() -> None:
-    from axel import repo_manager as rm
-
     repos = ["one", "two", "three"]
 
     assert rm._apply_sampling(repos, sample=None, seed=42) == repos
@@ -402,40 +404,28 @@ def test_apply_sampling_edge_cases() -> None:
     assert rm._apply_sampling(repos, sample=5, seed=42) == repos
 
 
-def test_load_repos_ignores_comments(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    file.write_text(
-        "https://example.com/a\n"
-        "# comment line\n"
-        "https://example.com/b # trailing comment\n"
-    )
-    assert load_repos(path=file) == [
+def test_load_repos_ignores_comments(readonly_repo_files: dict[str, Path]) -> None:
+    assert load_repos(path=readonly_repo_files["comments"]) == [
         "https://example.com/a",
         "https://example.com/b",
     ]
 
 
-def test_load_repos_strips_trailing_slash(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    file.write_text("https://example.com/repo/\n")
-    assert load_repos(path=file) == ["https://example.com/repo"]
+def test_load_repos_strips_trailing_slash(
+    readonly_repo_files: dict[str, Path],
+) -> None:
+    assert load_repos(path=readonly_repo_files["slash"]) == ["https://example.com/repo"]
 
 
-def test_load_repos_deduplicates(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    file.write_text(
-        "https://example.com/a\n" "https://example.com/a\n" "https://example.com/b\n"
-    )
-    assert load_repos(path=file) == [
+def test_load_repos_deduplicates(readonly_repo_files: dict[str, Path]) -> None:
+    assert load_repos(path=readonly_repo_files["duplicates"]) == [
         "https://example.com/a",
         "https://example.com/b",
     ]
 
 
-def test_load_repos_sorts_entries(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    file.write_text("https://example.com/b\nhttps://example.com/a\n")
-    assert load_repos(path=file) == [
+def test_load_repos_sorts_entries(readonly_repo_files: dict[str, Path]) -> None:
+    assert load_repos(path=readonly_repo_files["unsorted"]) == [
         "https://example.com/a",
         "https://example.com/b",
     ]
@@ -450,58 +440,65 @@ def test_add_repo_expands_user_home(monkeypatch, tmp_path: Path) -> None:
     assert load_repos(path=file) == ["https://example.com/repo"]
 
 
-def test_add_repo_no_duplicates(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    add_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == ["https://example.com/repo"]
-
-
-def test_add_repo_no_duplicates_case_insensitive(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/Repo", path=file)
-    add_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == ["https://example.com/Repo"]
+def test_add_repo_keeps_list_sorted(repo_file: Path) -> None:
+    add_repo("https://example.com/b", path=repo_file)
+    add_repo("https://example.com/a", path=repo_file)
+    assert load_repos(path=repo_file) == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
 
 
-def test_add_repo_strips_whitespace(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo\n", path=file)
-    assert load_repos(path=file) == ["https://example.com/repo"]
+def test_add_repo_sorts_case_insensitively(repo_file: Path) -> None:
+    add_repo("https://example.com/B", path=repo_file)
+    add_repo("https://example.com/a", path=repo_file)
+    assert load_repos(path=repo_file) == [
+        "https://example.com/a",
+        "https://example.com/B",
+    ]
 
 
-def test_remove_repo_case_insensitive(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/Repo", path=file)
-    remove_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == []
+def test_add_repos_merges_with_one_write(
+    seeded_repo_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    writes: list[Path] = []
+    original_write_text = Path.write_text
 
+    def recording_write_text(self: Path, *args: object, **kwargs: object) -> int:
+        writes.append(self)
+        return original_write_text(self, *args, **kwargs)
 
-def test_add_repo_strips_trailing_slash(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo/", path=file)
-    add_repo("https://example.com/repo", path=file)
-    assert load_repos(path=file) == ["https://example.com/repo"]
+    monkeypatch.setattr(Path, "write_text", recording_write_text)
 
+    repos = rm.add_repos(
+        [
+            "https://example.com/b/",
+            "https://example.com/A",
+            "https://example.com/REPO",
+            "https://example.com/a",
+        ],
+        path=seeded_repo_file,
+    )
 
-def test_add_repo_keeps_list_sorted(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/b", path=file)
-    add_repo("https://example.com/a", path=file)
-    assert load_repos(path=file) == [
-        "https://example.com/a",
+    assert repos == [
+        "https://example.com/A",
         "https://example.com/b",
+        "https://example.com/repo",
     ]
+    assert writes == [seeded_repo_file]
+    assert load_repos(path=seeded_repo_file) == repos
 
+    writes.clear()
+    rm.add_repos(["https://example.com/repo"], path=seeded_repo_file)
+    assert writes == []
 
-def test_add_repo_sorts_case_insensitively(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/B", path=file)
-    add_repo("https://example.com/a", path=file)
-    assert load_repos(path=file) == [
-        "https://example.com/a",
-        "https://example.com/B",
-    ]
+
+def test_add_repos_validates_before_writing(seeded_repo_file: Path) -> None:
+    with pytest.raises(ValueError):
+        rm.add_repos(
+            ["https://example.com/new", "github.com/u/repo"], path=seeded_repo_file
+        )
+    assert load_repos(path=seeded_repo_file) == ["https://example.com/repo"]
 
 
 def test_add_repo_creates_parent_dir(tmp_path: Path) -> None:
@@ -510,63 +507,97 @@ def test_add_repo_creates_parent_dir(tmp_path: Path) -> None:
     assert file.read_text() == "https://example.com/repo\n"
 
 
-def test_add_repo_requires_scheme(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
+def test_add_repo_requires_scheme(repo_file: Path) -> None:
     with pytest.raises(ValueError):
-        add_repo("github.com/u/repo", path=file)
+        add_repo("github.com/u/repo", path=repo_file)
 
 
-def test_remove_repo_missing(tmp_path: Path):
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    remove_repo("https://example.com/other", path=file)
-    assert load_repos(path=file) == ["https://example.com/repo"]
+def test_remove_repo_missing(seeded_repo_file: Path):
+    remove_repo("https://example.com/other", path=seeded_repo_file)
+    assert load_repos(path=seeded_repo_file) == ["https://example.com/repo"]
 
 
-def test_remove_repo_strips_whitespace(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    remove_repo("https://example.com/repo \n", path=file)
-    assert load_repos(path=file) == []
+@pytest.mark.parametrize(
+    ("added", "expected"),
+    [
+        pytest.param(
+            ["https://example.com/repo", "https://example.com/repo"],
+            ["https://example.com/repo"],
+            id="no-duplicates",
+        ),
+        pytest.param(
+            ["https://example.com/Repo", "https://example.com/repo"],
+            ["https://example.com/Repo"],
+            id="no-duplicates-case-insensitive",
+        ),
+        pytest.param(
+            ["https://example.com/repo\n"],
+            ["https://example.com/repo"],
+            id="strips-whitespace",
+        ),
+        pytest.param(
+            ["https://example.com/repo/", "https://example.com/repo"],
+            ["https://example.com/repo"],
+            id="strips-trailing-slash",
+        ),
+    ],
+)
+def test_add_repo_normalizes_urls(
+    repo_file: Path, added: list[str], expected: list[str]
+) -> None:
+    for url in added:
+        add_repo(url, path=repo_file)
+    assert load_repos(path=repo_file) == expected
 
 
-def test_remove_repo_strips_trailing_slash(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    remove_repo("https://example.com/repo/", path=file)
-    assert load_repos(path=file) == []
+@pytest.mark.parametrize(
+    ("stored", "removed"),
+    [
+        pytest.param(
+            "https://example.com/Repo",
+            "https://example.com/repo",
+            id="case-insensitive",
+        ),
+        pytest.param(
+            "https://example.com/repo",
+            "https://example.com/repo \n",
+            id="strips-whitespace",
+        ),
+        pytest.param(
+            "https://example.com/repo",
+            "https://example.com/repo/",
+            id="strips-trailing-slash",
+        ),
+    ],
+)
+def test_remove_repo_normalizes_urls(
+    repo_file: Path, stored: str, removed: str
+) -> None:
+    repo_file.write_text(f"{stored}\n")
+    remove_repo(removed, path=repo_file)
+    assert load_repos(path=repo_file) == []
 
 
-def test_remove_repo_sorts_remaining(tmp_path: Path) -> None:
-    file = tmp_path / "repos.txt"
-    file.write_text(
+def test_remove_repo_sorts_remaining(repo_file: Path) -> None:
+    repo_file.write_text(
         "https://example.com/b\nhttps://example.com/a\nhttps://example.com/c\n"
     )
-    remove_repo("https://example.com/c", path=file)
-    assert load_repos(path=file) == [
+    remove_repo("https://example.com/c", path=repo_file)
+    assert load_repos(path=repo_file) == [
         "https://example.com/a",
         "https://example.com/b",
     ]
 
 
-def test_env_default_var(monkeypatch, tmp_path: Path):
-    repo_file = tmp_path / "repos.txt"
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
-    import axel.repo_manager as rm
-
-    importlib.reload(rm)
+def test_env_default_var(env_repo_file: Path):
     rm.add_repo("https://example.com/repo")
-    assert repo_file.read_text().strip() == "https://example.com/repo"
+    assert env_repo_file.read_text().strip() == "https://example.com/repo"
 
 
-def test_env_dynamic_at_runtime(monkeypatch, tmp_path: Path) -> None:
+def test_env_dynamic_at_runtime(env_repo_file: Path) -> None:
     """``AXEL_REPO_FILE`` is honored without reloading the module."""
-    repo_file = tmp_path / "repos_runtime.txt"
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
-    import axel.repo_manager as rm
-
     rm.add_repo("https://example.com/runtime")
-    assert repo_file.read_text().strip() == "https://example.com/runtime"
+    assert env_repo_file.read_text().strip() == "https://example.com/runtime"
 
 
 def test_env_var_expands_user(monkeypatch, tmp_path: Path) -> None:
@@ -575,65 +606,50 @@ def test_env_var_expands_user(monkeypatch, tmp_path: Path) -> None:
     home.mkdir()
     monkeypatch.setenv("HOME", str(home))
     monkeypatch.setenv("AXEL_REPO_FILE", "~/repos.txt")
-    import axel.repo_manager as rm
-
     rm.add_repo("https://example.com/tilde")
     assert rm.get_repo_file() == home / "repos.txt"
     assert (home / "repos.txt").read_text().strip() == "https://example.com/tilde"
 
 
-def test_remove_repo_leaves_newline(tmp_path: Path) -> None:
+def test_remove_repo_leaves_newline(repo_file: Path) -> None:
     """Line 38 in remove_repo appends a trailing newline when repos remain."""
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo1", path=file)
-    add_repo("https://example.com/repo2", path=file)
-    remove_repo("https://example.com/repo1", path=file)
-    assert file.read_text() == "https://example.com/repo2\n"
+    rm.add_repos(
+        ["https://example.com/repo1", "https://example.com/repo2"], path=repo_file
+    )
+    remove_repo("https://example.com/repo1", path=repo_file)
+    assert repo_file.read_text() == "https://example.com/repo2\n"
 
 
-def test_cli_add_and_list_direct(tmp_path: Path, capsys) -> None:
+def test_cli_add_and_list_direct(repo_file: Path, capsys) -> None:
     """Call ``main`` directly to include CLI logic in coverage metrics."""
-    from axel import repo_manager as rm
-
-    file = tmp_path / "repos.txt"
-    rm.main(["--path", str(file), "add", "https://example.com/repo"])  # add
+    rm.main(["--path", str(repo_file), "add", "https://example.com/repo"])  # add
     output = capsys.readouterr().out.strip().splitlines()
     assert output == ["Repositories:", "- https://example.com/repo"]
 
-    rm.main(["--path", str(file), "list"])  # list
+    rm.main(["--path", str(repo_file), "list"])  # list
     output = capsys.readouterr().out.strip().splitlines()
     assert output == ["Repositories:", "- https://example.com/repo"]
 
 
-def test_cli_default_lists(tmp_path: Path, capsys) -> None:
+def test_cli_default_lists(seeded_repo_file: Path, capsys) -> None:
     """When no subcommand is provided the repo list is printed."""
-    from axel import repo_manager as rm
-
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    rm.main(["--path", str(file)])
+    rm.main(["--path", str(seeded_repo_file)])
     output = capsys.readouterr().out.strip().splitlines()
     assert output == ["Repositories:", "- https://example.com/repo"]
 
 
-def test_cli_remove_direct(tmp_path: Path, capsys) -> None:
+def test_cli_remove_direct(seeded_repo_file: Path, capsys) -> None:
     """Direct call of ``main`` covers the ``remove`` branch."""
-    from axel import repo_manager as rm
-
-    file = tmp_path / "repos.txt"
-    add_repo("https://example.com/repo", path=file)
-    rm.main(["--path", str(file), "remove", "https://example.com/repo"])  # remove
+    rm.main(
+        ["--path", str(seeded_repo_file), "remove", "https://example.com/repo"]
+    )  # remove
     output = capsys.readouterr().out.strip().splitlines()
     assert output == ["Repositories:", "- (none)"]
-    assert not file.read_text()
+    assert not seeded_repo_file.read_text()
 
 
-def test_cli_honors_env_var(monkeypatch, tmp_path: Path, capsys) -> None:
+def test_cli_honors_env_var(env_repo_file: Path, capsys) -> None:
     """CLI uses ``AXEL_REPO_FILE`` when ``--path`` is omitted."""
-    repo_file = tmp_path / "repos.txt"
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
-    from axel import repo_manager as rm
-
     rm.main(["add", "https://example.com/env-cli"])
     output = capsys.readouterr().out.strip().splitlines()
     assert output == ["Repositories:", "- https://example.com/env-cli"]
@@ -643,92 +659,42 @@ def test_cli_honors_env_var(monkeypatch, tmp_path: Path, capsys) -> None:
     assert output == ["Repositories:", "- https://example.com/env-cli"]
 
 
-def test_load_repos_defaults(monkeypatch, tmp_path: Path) -> None:
+def test_load_repos_defaults(env_repo_file: Path) -> None:
     """When no path is provided ``AXEL_REPO_FILE`` is used."""
-    repo_file = tmp_path / "repos.txt"
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
-    import axel.repo_manager as rm
-
     assert rm.load_repos() == []  # file doesn't exist yet
     rm.add_repo("https://example.com/repo")  # default path
     assert rm.load_repos() == ["https://example.com/repo"]
 
 
-def test_remove_repo_defaults(monkeypatch, tmp_path: Path) -> None:
+def test_remove_repo_defaults(env_repo_file: Path) -> None:
     """``remove_repo`` should also honor ``AXEL_REPO_FILE``."""
-    repo_file = tmp_path / "repos.txt"
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
-    import axel.repo_manager as rm
-
     rm.add_repo("https://example.com/repo")
     rm.remove_repo("https://example.com/repo")
     assert rm.load_repos() == []
 
 
-def test_fetch_repos(monkeypatch, tmp_path: Path) -> None:
+def test_fetch_repos(monkeypatch, repo_file: Path) -> None:
     """``fetch_repos`` retrieves repos and writes them to disk."""
-    repo_file = tmp_path / "repos.txt"
-
-    def fake_get(url, headers=None, params=None, timeout=0):
-        class Resp:
-            def __init__(self, data):
-                self._data = data
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        if params["page"] == 1:
-            return Resp(
-                [
-                    {"html_url": "https://github.com/u/a"},
-                    {"html_url": "https://github.com/u/b"},
-                ]
-            )
-        return Resp([])
 
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr(
+        "axel.repo_manager.requests.get", _make_fake_get(_TWO_REPO_PAGES)
+    )
     repos = rm.fetch_repos(path=repo_file)
     assert repos == [
         "https://github.com/u/a",
         "https://github.com/u/b",
     ]
-    assert repo_file.read_text() == "https://github.com/u/a\nhttps://github.com/u/b\n"
+    assert repo_file.read_text() == _TWO_REPO_FILE
 
 
-def test_cli_fetch(monkeypatch, tmp_path: Path, capsys) -> None:
+def test_cli_fetch(monkeypatch, repo_file: Path, capsys) -> None:
     """CLI ``fetch`` writes and prints fetched repositories."""
-    repo_file = tmp_path / "repos.txt"
-
-    def fake_get(url, headers=None, params=None, timeout=0):
-        class Resp:
-            def __init__(self, data):
-                self._data = data
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        if params["page"] == 1:
-            return Resp(
-                [
-                    {"html_url": "https://github.com/u/a"},
-                    {"html_url": "https://github.com/u/b"},
-                ]
-            )
-        return Resp([])
 
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr(
+        "axel.repo_manager.requests.get", _make_fake_get(_TWO_REPO_PAGES)
+    )
     rm.main(["--path", str(repo_file), "fetch"])
     output = capsys.readouterr().out.strip().splitlines()
     assert output == [
@@ -736,38 +702,17 @@ def test_cli_fetch(monkeypatch, tmp_path: Path, capsys) -> None:
         "- https://github.com/u/a",
         "- https://github.com/u/b",
     ]
-    assert repo_file.read_text() == "https://github.com/u/a\nhttps://github.com/u/b\n"
+    assert repo_file.read_text() == _TWO_REPO_FILE
 
 
-def test_cli_fetch_accepts_token_flag(monkeypatch, tmp_path: Path, capsys) -> None:
+def test_cli_fetch_accepts_token_flag(monkeypatch, repo_file: Path, capsys) -> None:
     """Passing ``--token`` bypasses the ``GH_TOKEN``/``GITHUB_TOKEN`` env vars."""
-    repo_file = tmp_path / "repos.txt"
-
-    def fake_get(url, headers=None, params=None, timeout=0):
-        class Resp:
-            def __init__(self, data):
-                self._data = data
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        if params["page"] == 1:
-            return Resp(
-                [
-                    {"html_url": "https://github.com/u/a"},
-                    {"html_url": "https://github.com/u/b"},
-                ]
-            )
-        return Resp([])
 
     monkeypatch.delenv("GH_TOKEN", raising=False)
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr(
+        "axel.repo_manager.requests.get", _make_fake_get(_TWO_REPO_PAGES)
+    )
     rm.main(["--path", str(repo_file), "fetch", "--token", "token"])
     output = capsys.readouterr().out.strip().splitlines()
     assert output == [
@@ -775,34 +720,20 @@ def test_cli_fetch_accepts_token_flag(monkeypatch, tmp_path: Path, capsys) -> No
         "- https://github.com/u/a",
         "- https://github.com/u/b",
     ]
-    assert repo_file.read_text() == "https://github.com/u/a\nhttps://github.com/u/b\n"
+    assert repo_file.read_text() == _TWO_REPO_FILE
 
 
-def test_cli_fetch_accepts_visibility_flag(monkeypatch, tmp_path: Path) -> None:
+def test_cli_fetch_accepts_visibility_flag(monkeypatch, repo_file: Path) -> None:
     """``--visibility`` limits repositories returned from GitHub."""
-    repo_file = tmp_path / "repos.txt"
     captured: dict[str, str | None] = {}
 
     def fake_get(url, headers=None, params=None, timeout=0):
         captured["visibility"] = params.get("visibility")
-
-        class Resp:
-            def __init__(self):
-                self._data = []
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        return Resp()
+        return _Resp([])
 
     monkeypatch.delenv("GH_TOKEN", raising=False)
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr("axel.repo_manager.requests.get", fake_get)
     rm.main(
         [
             "--path",
@@ -821,8 +752,6 @@ def test_fetch_repo_urls_requires_token(monkeypatch) -> None:
     """Fetching without ``GH_TOKEN``/``GITHUB_TOKEN`` raises an error."""
     monkeypatch.delenv("GH_TOKEN", raising=False)
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
-    from axel import repo_manager as rm
-
     with pytest.raises(RuntimeError):
         rm.fetch_repo_urls()
 
@@ -830,24 +759,9 @@ def test_fetch_repo_urls_requires_token(monkeypatch) -> None:
 def test_fetch_repo_urls_uses_github_token(monkeypatch) -> None:
     """``GITHUB_TOKEN`` is accepted when ``GH_TOKEN`` is missing."""
 
-    def fake_get(url, headers=None, params=None, timeout=0):
-        class Resp:
-            def __init__(self):
-                self._data = []
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        return Resp()
-
     monkeypatch.delenv("GH_TOKEN", raising=False)
     monkeypatch.setenv("GITHUB_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr("axel.repo_manager.requests.get", _make_fake_get({}))
     assert rm.fetch_repo_urls() == []
 
 
@@ -857,23 +771,10 @@ def test_fetch_repo_urls_accepts_visibility(monkeypatch) -> None:
 
     def fake_get(url, headers=None, params=None, timeout=0):
         captured["visibility"] = params.get("visibility")
-
-        class Resp:
-            def __init__(self):
-                self._data = []
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        return Resp()
+        return _Resp([])
 
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr("axel.repo_manager.requests.get", fake_get)
     rm.fetch_repo_urls(visibility="private")
     assert captured["visibility"] == "private"
 
@@ -889,25 +790,8 @@ def test_fetch_repo_urls_deduplicates_case_insensitive(monkeypatch) -> None:
         2: [],
     }
 
-    def fake_get(url, headers=None, params=None, timeout=0):
-        page = params.get("page", 1)
-
-        class Resp:
-            def __init__(self, data: list[dict[str, str]]):
-                self._data = data
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        return Resp(pages.get(page, []))
-
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr("axel.repo_manager.requests.get", _make_fake_get(pages))
     repos = rm.fetch_repo_urls()
 
     assert repos == ["https://github.com/example/Axel"]
@@ -925,53 +809,20 @@ def test_fetch_repo_urls_skips_invalid_entries(monkeypatch) -> None:
         2: [],
     }
 
-    def fake_get(url, headers=None, params=None, timeout=0):
-        page = params.get("page", 1)
-
-        class Resp:
-            def __init__(self, data: list[dict[str, object]]):
-                self._data = data
-
-            def json(self):
-                return self._data
-
-            def raise_for_status(self):
-                return None
-
-        return Resp(responses.get(page, []))
-
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr("axel.repo_manager.requests.get", _make_fake_get(responses))
     repos = rm.fetch_repo_urls()
 
     assert repos == ["https://github.com/example/valid"]
 
 
-def test_fetch_repos_defaults(monkeypatch, tmp_path: Path) -> None:
+def test_fetch_repos_defaults(monkeypatch, env_repo_file: Path) -> None:
     """``fetch_repos`` honors ``AXEL_REPO_FILE`` when no path is given."""
-    repo_file = tmp_path / "repos.txt"
-
-    def fake_get(url, headers=None, params=None, timeout=0):
-        class Resp:
-            def __init__(self, data):
-                self._data = data
-
-            def json(self):
-                return self._data
 
-            def raise_for_status(self):
-                return None
-
-        if params["page"] == 1:
-            return Resp([{"html_url": "https://github.com/u/a"}])
-        return Resp([])
-
-    monkeypatch.setenv("AXEL_REPO_FILE", str(repo_file))
     monkeypatch.setenv("GH_TOKEN", "token")
-    monkeypatch.setattr(requests, "get", fake_get)
-    from axel import repo_manager as rm
-
+    monkeypatch.setattr(
+        "axel.repo_manager.requests.get",
+        _make_fake_get({1: [{"html_url": "https://github.com/u/a"}]}),
+    )
     rm.fetch_repos()
-    assert repo_file.read_text() == "https://github.com/u/a\n"
+    assert env_repo_file.read_text() == "https://github.com/u/a\n"
@@ -1,12 +1,10 @@
 import json
-import subprocess
-import sys
 from pathlib import Path
+from typing import Callable
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))  # noqa: E402
-import pytest  # noqa: E402
+import pytest
 
-from axel import (  # noqa: E402
+from axel import (
     add_task,
     clear_tasks,
     complete_task,
@@ -14,22 +12,51 @@ from axel import (  # noqa: E402
     load_tasks,
     remove_task,
 )
+from axel import task_manager as tm
+
+_ONE_TASK = [{"id": 1, "description": "write docs", "completed": False}]
+_ONE_TASK_DONE = [{"id": 1, "description": "write docs", "completed": True}]
+_REMAINING_TASK = [{"id": 2, "description": "write code", "completed": False}]
+
+
+def _seed_tasks(path: Path, *descriptions: str) -> None:
+    """Write pending tasks for ``descriptions`` to ``path`` in a single write."""
+
+    tasks = [
+        {"id": index, "description": description, "completed": False}
+        for index, description in enumerate(descriptions, start=1)
+    ]
+    path.write_bytes(json.dumps(tasks).encode())
+
+
+@pytest.fixture(scope="module")
+def one_task_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a task file holding a single pending task for read-only tests."""
+
+    file = tmp_path_factory.mktemp("tasks") / "tasks.json"
+    _seed_tasks(file, "write docs")
+    return file
+
+
+@pytest.fixture
+def env_task_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point ``AXEL_TASK_FILE`` at a fresh file for tests of the default path."""
+
+    file = tmp_path / "tasks.json"
+    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
+    return file
 
 
 def test_add_and_load(tmp_path: Path) -> None:
     file = tmp_path / "tasks.json"
     add_task("write docs", path=file)
-    assert load_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=file) == _ONE_TASK
 
 
 def test_add_task_strips_whitespace(tmp_path: Path) -> None:
     file = tmp_path / "tasks.json"
     add_task("  write docs  \n", path=file)
-    assert load_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=file) == _ONE_TASK
 
 
 def test_add_task_preserves_unicode(tmp_path: Path) -> None:
@@ -49,8 +76,7 @@ def test_add_task_rejects_empty_description(tmp_path: Path) -> None:
 
 def test_complete_task(tmp_path: Path) -> None:
     file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    add_task("write code", path=file)
+    _seed_tasks(file, "write docs", "write code")
     complete_task(1, path=file)
     assert load_tasks(path=file) == [
         {"id": 1, "description": "write docs", "completed": True},
@@ -60,19 +86,14 @@ def test_complete_task(tmp_path: Path) -> None:
 
 def test_remove_task(tmp_path: Path) -> None:
     file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    add_task("write code", path=file)
+    _seed_tasks(file, "write docs", "write code")
     remove_task(1, path=file)
-    assert load_tasks(path=file) == [
-        {"id": 2, "description": "write code", "completed": False},
-    ]
+    assert load_tasks(path=file) == _REMAINING_TASK
 
 
-def test_remove_task_missing_id(tmp_path: Path) -> None:
-    file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
+def test_remove_task_missing_id(one_task_file: Path) -> None:
     with pytest.raises(ValueError):
-        remove_task(2, path=file)
+        remove_task(2, path=one_task_file)
 
 
 def test_add_task_expands_user_home(monkeypatch, tmp_path: Path) -> None:
@@ -87,62 +108,41 @@ def test_add_task_expands_user_home(monkeypatch, tmp_path: Path) -> None:
     ]
 
 
-def test_cli_add(tmp_path: Path) -> None:
+def test_cli_add(
+    tmp_path: Path, run_module: Callable[..., None], capsys: pytest.CaptureFixture[str]
+) -> None:
     file = tmp_path / "tasks.json"
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.task_manager",
-            "--path",
-            str(file),
-            "add",
-            "write code",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
-    data = json.loads(file.read_text())
+    run_module("axel.task_manager", "--path", str(file), "add", "write code")
+    stdout = capsys.readouterr().out
+    data = json.loads(file.read_bytes())
     assert data == [
         {"id": 1, "description": "write code", "completed": False},
     ]
-    assert "1. [ ] write code" in result.stdout
+    assert "1. [ ] write code" in stdout
 
 
 def test_main_list_supports_json_output(
-    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    one_task_file: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    from axel import task_manager
-
-    tasks_file = tmp_path / "tasks.json"
-    add_task("write docs", path=tasks_file)
-
-    task_manager.main(
+    tm.main(
         [
             "list",
             "--path",
-            str(tasks_file),
+            str(one_task_file),
             "--json",
         ]
     )
 
     output = capsys.readouterr().out.strip()
-    assert json.loads(output) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert json.loads(output) == _ONE_TASK
 
 
 def test_main_add_accepts_path_after_subcommand(
     tmp_path: Path, capsys: pytest.CaptureFixture[str]
 ) -> None:
-    from axel.task_manager import main
-
     file = tmp_path / "tasks.json"
 
-    main(
+    tm.main(
         [
             "add",
             "write docs",
@@ -151,39 +151,31 @@ def test_main_add_accepts_path_after_subcommand(
         ]
     )
 
-    assert load_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=file) == _ONE_TASK
     assert "1. [ ] write docs" in capsys.readouterr().out
 
 
 def test_main_add_uses_default_task_file(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import task_manager
-
     default_file = tmp_path / "tasks.json"
-    monkeypatch.setattr(task_manager, "get_task_file", lambda: default_file)
+    monkeypatch.setattr(tm, "get_task_file", lambda: default_file)
 
-    task_manager.main(["add", "write docs"])
+    tm.main(["add", "write docs"])
 
-    assert load_tasks(path=default_file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=default_file) == _ONE_TASK
 
 
 def test_main_add_supports_path_equals_form(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import task_manager
-
     home = tmp_path / "home"
     home.mkdir()
     monkeypatch.setenv("HOME", str(home))
 
     target = Path("~") / "nested" / "tasks.json"
 
-    task_manager.main(
+    tm.main(
         [
             "add",
             "write docs",
@@ -192,16 +184,12 @@ def test_main_add_supports_path_equals_form(
     )
 
     expected_file = home / "nested" / "tasks.json"
-    assert load_tasks(path=expected_file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=expected_file) == _ONE_TASK
 
 
 def test_main_add_accepts_path_before_subcommand(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    from axel import task_manager
-
     class SneakyStr(str):
         def __eq__(self, other: object) -> bool:
             return False
@@ -216,11 +204,9 @@ def test_main_add_accepts_path_before_subcommand(
         "write docs",
     ]
 
-    task_manager.main(argv)
+    tm.main(argv)
 
-    assert load_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=file) == _ONE_TASK
 
 
 def test_main_uses_sys_argv_when_none(
@@ -228,12 +214,10 @@ def test_main_uses_sys_argv_when_none(
 ) -> None:
     import types
 
-    from axel import task_manager
-
     file = tmp_path / "tasks.json"
 
     monkeypatch.setattr(
-        task_manager,
+        tm,
         "sys",
         types.SimpleNamespace(
             argv=[
@@ -246,96 +230,54 @@ def test_main_uses_sys_argv_when_none(
         ),
     )
 
-    task_manager.main(None)
+    tm.main(None)
 
-    assert load_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert load_tasks(path=file) == _ONE_TASK
 
 
 def test_main_rejects_path_without_value() -> None:
-    from axel.task_manager import main
-
     with pytest.raises(SystemExit) as excinfo:
-        main(["add", "write docs", "--path"])
+        tm.main(["add", "write docs", "--path"])
 
     assert excinfo.value.code != 0
 
 
-def test_cli_complete(tmp_path: Path) -> None:
+def test_cli_complete(
+    tmp_path: Path, run_module: Callable[..., None], capsys: pytest.CaptureFixture[str]
+) -> None:
     file = tmp_path / "tasks.json"
     add_task("write docs", path=file)
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.task_manager",
-            "--path",
-            str(file),
-            "complete",
-            "1",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
-    data = json.loads(file.read_text())
-    assert data == [
-        {"id": 1, "description": "write docs", "completed": True},
-    ]
-    assert "1. [x] write docs" in result.stdout
+    run_module("axel.task_manager", "--path", str(file), "complete", "1")
+    stdout = capsys.readouterr().out
+    data = json.loads(file.read_bytes())
+    assert data == _ONE_TASK_DONE
+    assert "1. [x] write docs" in stdout
 
 
-def test_cli_remove(tmp_path: Path) -> None:
+def test_cli_remove(
+    tmp_path: Path, run_module: Callable[..., None], capsys: pytest.CaptureFixture[str]
+) -> None:
     file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    add_task("write code", path=file)
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.task_manager",
-            "--path",
-            str(file),
-            "remove",
-            "1",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
-    data = json.loads(file.read_text())
-    assert data == [
-        {"id": 2, "description": "write code", "completed": False},
-    ]
-    assert "2. [ ] write code" in result.stdout
+    _seed_tasks(file, "write docs", "write code")
+    run_module("axel.task_manager", "--path", str(file), "remove", "1")
+    stdout = capsys.readouterr().out
+    data = json.loads(file.read_bytes())
+    assert data == _REMAINING_TASK
+    assert "2. [ ] write code" in stdout
 
 
 def test_main_remove(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    add_task("write code", path=file)
-    from axel.task_manager import main
-
-    main(["--path", str(file), "remove", "1"])
-    assert load_tasks(path=file) == [
-        {"id": 2, "description": "write code", "completed": False},
-    ]
+    _seed_tasks(file, "write docs", "write code")
+    tm.main(["--path", str(file), "remove", "1"])
+    assert load_tasks(path=file) == _REMAINING_TASK
     assert "2. [ ] write code" in capsys.readouterr().out
 
 
-def test_env_default_var(monkeypatch, tmp_path: Path) -> None:
+def test_env_default_var(env_task_file: Path) -> None:
     """``AXEL_TASK_FILE`` controls the default task file."""
-    task_file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(task_file))
-    import axel.task_manager as tm
-
     tm.add_task("dyn")
-    assert task_file.read_text().strip()
+    assert env_task_file.read_text().strip()
 
 
 def test_load_tasks_empty_file(tmp_path: Path) -> None:
@@ -359,98 +301,56 @@ def test_load_tasks_non_list_json(tmp_path: Path) -> None:
     assert load_tasks(path=file) == []
 
 
-def test_load_tasks_default_path(monkeypatch, tmp_path: Path) -> None:
+def test_load_tasks_default_path(env_task_file: Path) -> None:
     """``load_tasks`` uses ``AXEL_TASK_FILE`` when no path is provided."""
-    file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
-    import axel.task_manager as tm
-
     assert tm.load_tasks() == []
 
 
-def test_complete_task_default_path(monkeypatch, tmp_path: Path) -> None:
+def test_complete_task_default_path(env_task_file: Path) -> None:
     """``complete_task`` honors ``AXEL_TASK_FILE`` when ``path`` is omitted."""
-    file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
-    import axel.task_manager as tm
-
     tm.add_task("write docs")
     tm.complete_task(1)
-    assert tm.load_tasks() == [
-        {"id": 1, "description": "write docs", "completed": True},
-    ]
+    assert tm.load_tasks() == _ONE_TASK_DONE
 
 
-def test_remove_task_default_path(monkeypatch, tmp_path: Path) -> None:
+def test_remove_task_default_path(env_task_file: Path) -> None:
     """``remove_task`` honors ``AXEL_TASK_FILE`` when ``path`` is omitted."""
-    file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
-    import axel.task_manager as tm
-
-    tm.add_task("write docs")
-    tm.add_task("write code")
+    _seed_tasks(env_task_file, "write docs", "write code")
     tm.remove_task(1)
-    assert tm.load_tasks() == [
-        {"id": 2, "description": "write code", "completed": False},
-    ]
+    assert tm.load_tasks() == _REMAINING_TASK
 
 
-def test_list_tasks_default_path(monkeypatch, tmp_path: Path) -> None:
+def test_list_tasks_default_path(monkeypatch, one_task_file: Path) -> None:
     """``list_tasks`` honors ``AXEL_TASK_FILE`` when ``path`` is omitted."""
-    file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
-    import axel.task_manager as tm
+    monkeypatch.setenv("AXEL_TASK_FILE", str(one_task_file))
+    assert tm.list_tasks() == _ONE_TASK
 
-    tm.add_task("write docs")
-    assert tm.list_tasks() == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
 
-
-def test_clear_tasks_default_path(monkeypatch, tmp_path: Path) -> None:
+def test_clear_tasks_default_path(env_task_file: Path) -> None:
     """``clear_tasks`` honors ``AXEL_TASK_FILE`` when ``path`` is omitted."""
-    file = tmp_path / "tasks.json"
-    monkeypatch.setenv("AXEL_TASK_FILE", str(file))
-    import axel.task_manager as tm
-
     tm.add_task("write docs")
     tm.clear_tasks()
     assert tm.load_tasks() == []
 
 
-def test_apply_sampling_edge_cases() -> None:
-    """Task sampling helper should mirror repo sampling edge cases."""
-
-    import axel.task_manager as tm
-
-    tasks = [
-        {"id": 1},
-        {"id": 2},
-        {"id": 3},
-    ]
-
-    assert tm._apply_sampling(tasks, sample=None, seed=42) == tasks
-    assert tm._apply_sampling(tasks, sample=0, seed=42) == []
-    assert tm._apply_sampling(tasks, sample=5, seed=42) == tasks
-
-
-def test_apply_sampling_deterministic() -> None:
-    """Sampling with the same seed should produce stable selections."""
-
-    import axel.task_manager as tm
+@pytest.mark.parametrize(
+    ("size", "seed"), [(0, 0), (1, 42), (3, 42), (4, 99), (10, 7), (25, -3)]
+)
+def test_apply_sampling_properties(size: int, seed: int) -> None:
+    """Sampling handles edge cases and yields stable, ordered subsets."""
 
-    tasks = [
-        {"id": 1},
-        {"id": 2},
-        {"id": 3},
-        {"id": 4},
-    ]
+    tasks = [{"id": i} for i in range(1, size + 1)]
 
-    first = tm._apply_sampling(tasks, sample=2, seed=99)
-    second = tm._apply_sampling(tasks, sample=2, seed=99)
+    assert tm._apply_sampling(tasks, sample=None, seed=seed) == tasks
+    assert tm._apply_sampling(tasks, sample=0, seed=seed) == []
+    assert tm._apply_sampling(tasks, sample=size + 5, seed=seed) == tasks
 
-    assert first == second
-    assert [task["id"] for task in first] == [task["id"] for task in second]
+    for sample in range(1, size + 1):
+        first = tm._apply_sampling(tasks, sample=sample, seed=seed)
+        assert first == tm._apply_sampling(tasks, sample=sample, seed=seed)
+        ids = [task["id"] for task in first]
+        assert len(ids) == sample
+        assert ids == sorted(set(ids))
 
 
 def test_main_list_supports_sampling(
@@ -459,18 +359,12 @@ def test_main_list_supports_sampling(
     """``task_manager.main`` should apply sampling before printing tasks."""
 
     file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    add_task("write code", path=file)
-    add_task("write tests", path=file)
-
-    import axel.task_manager as tm
+    _seed_tasks(file, "write docs", "write code", "write tests")
 
     tasks = tm.load_tasks(path=file)
     expected = tm._apply_sampling(tasks, sample=2, seed=7)
 
-    from axel.task_manager import main
-
-    main(
+    tm.main(
         [
             "--path",
             str(file),
@@ -492,28 +386,20 @@ def test_main_list_supports_sampling(
     assert printed_ids == [task["id"] for task in expected]
 
 
-def test_complete_task_missing_id(tmp_path: Path) -> None:
+def test_complete_task_missing_id(one_task_file: Path) -> None:
     """Completing an unknown task id raises ``ValueError``."""
-    file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
     with pytest.raises(ValueError):
-        complete_task(2, path=file)
+        complete_task(2, path=one_task_file)
 
 
-def test_list_tasks(tmp_path: Path) -> None:
+def test_list_tasks(one_task_file: Path) -> None:
     """``list_tasks`` returns the stored tasks."""
-    file = tmp_path / "tasks.json"
-    add_task("write docs", path=file)
-    assert list_tasks(path=file) == [
-        {"id": 1, "description": "write docs", "completed": False},
-    ]
+    assert list_tasks(path=one_task_file) == _ONE_TASK
 
 
 def test_main_branches(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """``main`` handles add, complete and list commands."""
     file = tmp_path / "tasks.json"
-    import axel.task_manager as tm
-
     tm.main(["--path", str(file), "add", "write docs"])
     assert "1. [ ] write docs" in capsys.readouterr().out
     tm.main(["--path", str(file), "complete", "1"])
@@ -532,8 +418,6 @@ def test_main_list_handles_missing_completed_field(
     file = tmp_path / "tasks.json"
     file.write_text(json.dumps([{"id": 1, "description": "legacy task"}]))
 
-    from axel import task_manager as tm
-
     tm.main(["--path", str(file), "list"])
     output = capsys.readouterr().out
     assert "1. [ ] legacy task" in output
@@ -546,22 +430,8 @@ def test_clear_tasks(tmp_path: Path) -> None:
     assert load_tasks(path=file) == []
 
 
-def test_cli_clear(tmp_path: Path) -> None:
+def test_cli_clear(tmp_path: Path, run_module: Callable[..., None]) -> None:
     file = tmp_path / "tasks.json"
     add_task("write docs", path=file)
-    subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "axel.task_manager",
-            "--path",
-            str(file),
-            "clear",
-        ],
-        cwd=Path(__file__).resolve().parents[1],
-        capture_output=True,
-        text=True,
-        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
-        check=True,
-    )
+    run_module("axel.task_manager", "--path", str(file), "clear")
     assert load_tasks(path=file) == []
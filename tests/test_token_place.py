@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -11,28 +12,13 @@ import pytest
 import axel.token_place as token_place
 
 
-@pytest.fixture(autouse=True)
-def _reset_model_cache() -> None:
-    """Ensure cached model metadata does not leak between tests."""
-
-    token_place._clear_model_cache()
-    yield
-    token_place._clear_model_cache()
-
-
+@dataclass(frozen=True, slots=True, kw_only=True)
 class DummyResponse:
     """Simple stand-in for :mod:`requests` responses."""
 
-    def __init__(
-        self,
-        *,
-        status_code: int = 200,
-        data: object | None = None,
-        exc: Exception | None = None,
-    ):
-        self.status_code = status_code
-        self._data = data
-        self._exc = exc
+    status_code: int = 200
+    data: object | None = None
+    exc: Exception | None = None
 
     def raise_for_status(self) -> None:
         if self.status_code >= 400:
@@ -41,9 +27,9 @@ class DummyResponse:
             )
 
     def json(self) -> object:
-        if self._exc is not None:
-            raise self._exc
-        return self._data
+        if self.exc is not None:
+            raise self.exc
+        return self.data
 
 
 def test_rotate_api_keys_requests_new_tokens(
@@ -63,7 +49,7 @@ def test_rotate_api_keys_requests_new_tokens(
             data={"data": {"relay_key": "relay-new", "server_key": "server-new"}}
         )
 
-    monkeypatch.setattr(token_place.requests, "post", fake_post)
+    monkeypatch.setattr(token_place._SESSION, "post", fake_post)
 
     result = token_place.rotate_api_keys(
         base_url="https://token.place/api/v1", api_key="secret", timeout=15
@@ -112,6 +98,21 @@ def test_extract_rotated_keys_handles_nested_payloads() -> None:
     assert secrets == {"relay": "relay-primary", "server": "server-root"}
 
 
+def test_extract_rotated_keys_handles_deeply_nested_payloads() -> None:
+    """Deep nesting should not exhaust the interpreter's recursion limit."""
+
+    payload: dict[str, object] = {"relay_key": " relay-deep ", "server": "s"}
+    for _ in range(5000):
+        payload = {"data": payload}
+    shared = {"message": "ok"}
+
+    secrets = token_place._extract_rotated_keys(
+        {"data": [shared, "ignored", shared, [[payload]]]}
+    )
+
+    assert secrets == {"relay": "relay-deep", "server": "s"}
+
+
 def test_rotate_api_keys_errors_when_no_secrets(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -122,7 +123,7 @@ def test_rotate_api_keys_errors_when_no_secrets(
     ) -> DummyResponse:  # pragma: no cover - helper
         return DummyResponse(data={"data": {"message": "ok"}})
 
-    monkeypatch.setattr(token_place.requests, "post", fake_post)
+    monkeypatch.setattr(token_place._SESSION, "post", fake_post)
 
     with pytest.raises(
         token_place.TokenPlaceError, match="did not include rotated keys"
@@ -152,7 +153,7 @@ def test_list_models_parses_openai_like_payload(
         return response
 
     monkeypatch.setattr(
-        token_place.requests,
+        token_place._SESSION,
         "get",
         fake_get,
     )
@@ -332,7 +333,7 @@ def test_list_models_raises_token_place_error(
         raise token_place.requests.RequestException("boom")
 
     monkeypatch.setattr(
-        token_place.requests,
+        token_place._SESSION,
         "get",
         fake_get,
     )
@@ -355,7 +356,7 @@ def test_list_models_includes_authorization_header(
         return DummyResponse(data={"data": []})
 
     monkeypatch.setattr(
-        token_place.requests,
+        token_place._SESSION,
         "get",
         fake_get,
     )
@@ -379,7 +380,7 @@ def test_list_models_supports_plain_list_payload(
         return DummyResponse(data=["model-one", {"name": "model-two"}])
 
     monkeypatch.setattr(
-        token_place.requests,
+        token_place._SESSION,
         "get",
         fake_get,
     )
@@ -401,7 +402,7 @@ def test_list_models_supports_models_key(
         return DummyResponse(data={"models": [{"model": "alpha"}, "beta"]})
 
     monkeypatch.setattr(
-        token_place.requests,
+        token_place._SESSION,
         "get",
         fake_get,
     )
@@ -505,6 +506,25 @@ def test_plan_client_integrations_requires_token_repo() -> None:
     assert token_place.plan_client_integrations(repos) == []
 
 
+def test_plan_client_integrations_accepts_iterables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repositories may be streamed from a generator in a single pass."""
+
+    monkeypatch.setattr(
+        token_place,
+        "quest_detail",
+        lambda primary_slug, secondary_slug, **_: f"{primary_slug}->{secondary_slug}",
+    )
+
+    lines = ["example/token.place\n", "example/alpha\n", "\n"]
+    integrations = token_place.plan_client_integrations(line.strip() for line in lines)
+
+    assert [integration.detail for integration in integrations] == [
+        "example/token.place->example/alpha",
+    ]
+
+
 def test_plan_client_integrations_parses_varied_repos(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -549,7 +569,6 @@ def test_plan_client_integrations_reuses_model_metadata(
         calls.append((base_url, api_key))
         return ["model-a"]
 
-    token_place._clear_model_cache()
     monkeypatch.setattr(token_place, "list_models", fake_list_models)
 
     repos = [
@@ -564,7 +583,6 @@ def test_plan_client_integrations_reuses_model_metadata(
 
     assert len(calls) == 1
     assert calls[0] == ("https://token.place/api/v1", "secret")
-    token_place._clear_model_cache()
 
 
 def test_main_clients_prints_plan(
@@ -2,35 +2,34 @@ import pytest
 
 from axel import strip_ansi
 
-
-def test_strip_ansi_removes_codes():
-    colored = "\x1b[31merror\x1b[0m"
-    assert strip_ansi(colored) == "error"
-
-
-def test_strip_ansi_handles_cursor_codes() -> None:
-    """Non-color ANSI sequences should also be stripped."""
-    text = "\x1b[2Kerror"
-    assert strip_ansi(text) == "error"
-
-
-def test_strip_ansi_accepts_bytes() -> None:
-    """Byte strings should also be handled."""
-    assert strip_ansi(b"\x1b[31merror\x1b[0m") == "error"
-
-
-def test_strip_ansi_none_returns_empty() -> None:
-    """Passing ``None`` should return an empty string."""
-    assert strip_ansi(None) == ""
+_COLORED = b"\x1b[31merror\x1b[0m"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        pytest.param("\x1b[31merror\x1b[0m", "error", id="color"),
+        pytest.param("\x1b[2Kerror", "error", id="cursor"),
+        pytest.param("\x1b]0;title\x07error", "error", id="osc-bel"),
+        pytest.param(
+            "\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\",
+            "link",
+            id="osc-st",
+        ),
+        pytest.param(_COLORED, "error", id="bytes"),
+        pytest.param(bytearray(_COLORED), "error", id="bytearray"),
+        pytest.param(memoryview(_COLORED), "error", id="memoryview"),
+        pytest.param(None, "", id="none"),
+        pytest.param("plain [31m text", "plain [31m text", id="no-escape"),
+        pytest.param(b"plain text", "plain text", id="bytes-no-escape"),
+    ],
+)
+def test_strip_ansi(raw: object, expected: str) -> None:
+    """Color, cursor and OSC sequences are removed from text and bytes-like input."""
+    assert strip_ansi(raw) == expected  # type: ignore[arg-type]
 
 
 def test_strip_ansi_invalid_type_raises() -> None:
     """Non-string inputs should raise ``TypeError``."""
     with pytest.raises(TypeError):
         strip_ansi(123)  # type: ignore[arg-type]
-
-
-def test_strip_ansi_removes_osc_sequences() -> None:
-    """OSC sequences like ``ESC]0;`` should be stripped."""
-    text = "\x1b]0;title\x07error"
-    assert strip_ansi(text) == "error"